@@ -6,7 +6,6 @@ SAVE THIS FILE AS: battery_monitor.py
 import board
 import analogio
 import time
-import json
 from adafruit_httpserver import Request, Response
 
 try:
@@ -15,6 +14,47 @@ try:
 except ImportError:
     BaseClass = object
 
+# /api/battery response bodies, filled with raw, ADC volts, battery volts;
+# indexed by the load test flag so the JSON literal is never formatted
+_BATTERY_JSON = (
+    b'{"raw": %d, "adc_voltage": %.3f, "battery_voltage": %.3f, "load_test": false}',
+    b'{"raw": %d, "adc_voltage": %.3f, "battery_voltage": %.3f, "load_test": true}'
+)
+_RAW_TOLERANCE = 64  # ADC counts (~3 mV) before the cached response is rebuilt
+
+# Details page body, passed through the foundation template once and cached
+_DETAILS_HTML = '''
+            <div class="module-section">
+                <h3>Battery Monitor Details</h3>
+                <div id="loadTestData">Loading...</div>
+                <button onclick="window.location.href='/'">Return to Dashboard</button>
+            </div>
+            <script>
+            function updateLoadTest() {
+                fetch('/api/battery')
+                    .then(r => r.json())
+                    .then(data => {
+                        document.getElementById('loadTestData').innerHTML =
+                            `Battery: ${data.battery_voltage}V<br>` +
+                            `ADC: ${data.adc_voltage}V<br>` +
+                            `Raw: ${data.raw}`;
+                    });
+            }
+
+            // Update immediately and then every second
+            updateLoadTest();
+            setInterval(updateLoadTest, 1000);
+            </script>
+            '''
+
+# Dashboard widget: a single button to the details page
+_DASHBOARD_HTML = '''
+        <div class="module-section">
+            <h3>Battery Monitor</h3>
+            <button onclick="window.location.href='/battery-load-test-page'">Battery Monitor</button>
+        </div>
+        ''' # REMOVED: batteryDataSummary div and associated JavaScript
+
 class BatteryMonitorModule(BaseClass):
     def __init__(self, foundation):
         if BaseClass != object:
@@ -30,64 +70,49 @@ class BatteryMonitorModule(BaseClass):
         # Load test state - this will now indicate if the load test *page* is active, not an active process
         self.load_test_active = False # Retained for potential future use or to indicate page view
 
+        # ADC conversion factors, folded once: 3.3 V reference over 16-bit range,
+        # battery measured through a 1:2 divider
+        self._adc_scale = 3.3 / 65536
+        self._battery_scale = 6.6 / 65536
+
+        # Last /api/battery body, reused while the ADC reading stays within
+        # _RAW_TOLERANCE counts and the load test flag is unchanged
+        self._last_raw = -1
+        self._last_load_test = None
+        self._cached_body = None
+
+        # Fully rendered details page, built on first request
+        self._page_bytes = None
+
         self._register_routes()
 
     def _register_routes(self):
         @self.foundation.server.route("/api/battery", methods=['GET'])
         def get_battery_status(request: Request):
             raw = self.adc.value
-            adc_voltage = (raw * 3.3) / 65536
-            battery_voltage = adc_voltage * 2.0
-
-            data = {
-                "raw": raw,
-                "adc_voltage": round(adc_voltage, 3),
-                "battery_voltage": round(battery_voltage, 3),
-                "load_test": self.load_test_active # Still reporting this flag if desired, but not displayed on page
-            }
+            load_test = self.load_test_active # Still reporting this flag if desired, but not displayed on page
 
-            return Response(request, json.dumps(data), content_type="application/json")
+            if (self._cached_body is None or load_test != self._last_load_test
+                    or abs(raw - self._last_raw) >= _RAW_TOLERANCE):
+                self._cached_body = _BATTERY_JSON[1 if load_test else 0] % (
+                    raw, raw * self._adc_scale, raw * self._battery_scale)
+                self._last_raw = raw
+                self._last_load_test = load_test
+
+            return Response(request, self._cached_body, content_type="application/json")
 
         @self.foundation.server.route("/battery-load-test-page", methods=['GET'])
         def show_load_test_page(request: Request):
             """Serve the second page with load test data and a return button."""
             self.load_test_active = True # Indicate load test data is being viewed
-            html_content = '''
-            <div class="module-section">
-                <h3>Battery Monitor Details</h3>
-                <div id="loadTestData">Loading...</div>
-                <button onclick="window.location.href='/'">Return to Dashboard</button>
-            </div>
-            <script>
-            function updateLoadTest() {
-                fetch('/api/battery')
-                    .then(r => r.json())
-                    .then(data => {
-                        document.getElementById('loadTestData').innerHTML =
-                            `Battery: ${data.battery_voltage}V<br>` +
-                            `ADC: ${data.adc_voltage}V<br>` +
-                            `Raw: ${data.raw}`;
-                    });
-            }
+            if self._page_bytes is None:
+                # Rendered on first view, once the foundation templates exist
+                self._page_bytes = self.foundation.templates.render_page(
+                    "Battery Monitor Details", _DETAILS_HTML, "").encode("utf-8")
+            return Response(request, self._page_bytes, content_type="text/html")
 
-            // Update immediately and then every second
-            updateLoadTest();
-            setInterval(updateLoadTest, 1000);
-            </script>
-            '''
-            return Response(request, self.foundation.templates.render_page("Battery Monitor Details", html_content, ""), content_type="text/html")
-
-
-    def update(self):
-        # The 'update' method remains, but does nothing specific for battery monitor.
-        pass
 
     def get_dashboard_html(self):
         """Return HTML for the initial Battery Monitor interface with only a single button."""
         self.load_test_active = False # Indicate not viewing detailed load test data
-        return '''
-        <div class="module-section">
-            <h3>Battery Monitor</h3>
-            <button onclick="window.location.href='/battery-load-test-page'">Battery Monitor</button>
-        </div>
-        ''' # REMOVED: batteryDataSummary div and associated JavaScript
+        return _DASHBOARD_HTML
@@ -51,27 +51,32 @@ def main():
                     
                     print("Testing automatic operation (30 seconds)...")
                     start_time = time.monotonic()
-                    publish_count = 0
+                    next_gc = start_time + 1.0
+                    publish_count = [0]  # list so the callback can update it
+                    
+                    def count_publish():
+                        publish_count[0] += 1
+                        print(f"Auto-publish #{publish_count[0]} completed")
+                    
+                    mqtt.on_publish = count_publish
                     
                     while time.monotonic() - start_time < 30:
                         foundation.server.poll()
                         
-                        # Check for MQTT publishes
-                        old_last_publish = mqtt.last_publish
+                        # Publishes are counted by the on_publish callback
+                        foundation.update_modules()
                         
-                        for module in foundation.modules.values():
-                            module.update()
-                            
-                        # Count publishes
-                        if mqtt.last_publish > old_last_publish:
-                            publish_count += 1
-                            print(f"Auto-publish #{publish_count} completed")
+                        # Collect once a second rather than every pass
+                        if time.monotonic() >= next_gc:
+                            gc.collect()
+                            next_gc += 1.0
                         
-                        time.sleep(1)
-                        gc.collect()
+                        # Short sleep keeps HTTP polling responsive
+                        time.sleep(0.02)
                     
                     print(f"Step 7 MQTT test PASSED")
-                    print(f"Published {publish_count} automatic updates")
+                    mqtt.on_publish = None
+                    print(f"Published {publish_count[0]} automatic updates")
                     print("Node ready for deployment")
                     
                 else:
@@ -5,6 +5,44 @@ Test SHT45 Step 2 with working dashboard
 import gc
 import time
 import wifi
+import asyncio
+
+# Scheduler cadences (seconds)
+HTTP_POLL_INTERVAL = 0.01      # yield between server.poll() calls
+DEFAULT_UPDATE_INTERVAL = 0.1  # modules without a read_interval of their own
+GC_INTERVAL = 5.0              # longest gap between garbage collections
+GC_CHECK_INTERVAL = 0.5        # how often free memory is checked
+GC_LOW_MEMORY = 8192           # collect early when free heap drops below this
+
+async def http_task(foundation):
+    """Poll the HTTP server, yielding to other tasks between polls."""
+    while True:
+        foundation.server.poll()
+        await asyncio.sleep(HTTP_POLL_INTERVAL)
+
+async def module_task(module):
+    """Run one module's update(), sleeping for the delay it asks for."""
+    while True:
+        module.update()
+        delay = module.update_delay()
+        await asyncio.sleep(delay if delay > 0 else DEFAULT_UPDATE_INTERVAL)
+
+async def gc_task():
+    """Collect garbage when free memory runs low, or at least every GC_INTERVAL."""
+    last_gc = time.monotonic()
+    while True:
+        now = time.monotonic()
+        if gc.mem_free() < GC_LOW_MEMORY or now - last_gc > GC_INTERVAL:
+            gc.collect()
+            last_gc = now
+        await asyncio.sleep(GC_CHECK_INTERVAL)
+
+async def run_scheduler(foundation):
+    """Run the HTTP, module and GC tasks concurrently."""
+    tasks = [asyncio.create_task(http_task(foundation)), asyncio.create_task(gc_task())]
+    for module in foundation.modules.values():
+        tasks.append(asyncio.create_task(module_task(module)))
+    await asyncio.gather(*tasks)
 
 def main():
     try:
@@ -35,7 +73,7 @@ def main():
             @foundation.server.route("/", methods=['GET'])
             def serve_dashboard(request):
                 try:
-                    dashboard_html = foundation.render_dashboard("PicoWicd SHT45 Test")
+                    dashboard_html = foundation.render_dashboard_bytes("PicoWicd SHT45 Test")
                     return Response(request, dashboard_html, content_type="text/html")
                 except Exception as e:
                     print(f"Dashboard error: {e}")
@@ -47,13 +85,8 @@ def main():
             print("✓ SHT45 hardware detected and working!")
             print("✓ Check dashboard for sensor status")
             
-            # Main loop
-            while True:
-                foundation.server.poll()
-                for module in foundation.modules.values():
-                    module.update()
-                time.sleep(0.1)
-                gc.collect()
+            # Main loop: one task per module plus HTTP polling and GC
+            asyncio.run(run_scheduler(foundation))
                 
         else:
             print("✗ Network failed")
@@ -1,19 +1,94 @@
-from adafruit_httpserver import Response
+from collections import deque
+from adafruit_httpserver import Response, SSEResponse
 from module_base import PicowicdModule
 
+CONSOLE_BUFFER_LINES = 50  # oldest lines are dropped once the buffer is full
+MAX_STREAM_CLIENTS = 2     # open /console-stream connections; oldest is closed first
+_MSG_NO_OUTPUT = b"No new output"  # /get-console reply when the buffer is empty
+
+# Console page body; static, so the rendered page is built once and cached
+_CONSOLE_HTML = """
+        <h2>Console Monitor</h2>
+        <a href="/" style="text-decoration: none;"><button>Back to Dashboard</button></a>
+
+        <p>Status: <span id="status">Monitor is OFF</span></p>
+
+        <button id="toggle-btn" onclick="toggleMonitor()">Start Monitor</button>
+        <button onclick="getConsole()">Get Output</button>
+
+        <div id="console-area" style="display: none;">
+            <h3>Console Output:</h3>
+            <pre id="console-output" style="background: #f0f0f0; padding: 10px; height: 200px; overflow-y: auto;"></pre>
+        </div>
+
+        <script>
+        let consoleStream = null;
+
+        function appendConsole(text) {
+            const output = document.getElementById('console-output');
+            output.textContent += text + '\\n';
+            output.scrollTop = output.scrollHeight;
+        }
+
+        function startStream() {
+            if (!window.EventSource || consoleStream) return;
+            consoleStream = new EventSource('/console-stream');
+            consoleStream.onmessage = event => appendConsole(event.data);
+            getConsole(); // pick up anything buffered before the stream opened
+        }
+
+        function stopStream() {
+            if (consoleStream) {
+                consoleStream.close();
+                consoleStream = null;
+            }
+        }
+
+        function toggleMonitor() {
+            fetch('/toggle-monitor', { method: 'POST' })
+                .then(response => response.text())
+                .then(result => {
+                    document.getElementById('status').textContent = result;
+                    if (result.includes('ON')) {
+                        document.getElementById('toggle-btn').textContent = 'Stop Monitor';
+                        document.getElementById('console-area').style.display = 'block';
+                        startStream();
+                    } else {
+                        document.getElementById('toggle-btn').textContent = 'Start Monitor';
+                        document.getElementById('console-area').style.display = 'none';
+                        stopStream();
+                    }
+                });
+        }
+
+        function getConsole() {
+            fetch('/get-console', { method: 'POST' })
+                .then(response => response.text())
+                .then(result => {
+                    if (result !== 'No new output') {
+                        appendConsole(result);
+                    }
+                });
+        }
+        </script>
+        """
+
 class ConsoleMonitorModule(PicowicdModule):
     def __init__(self, foundation):
         super().__init__(foundation)
         self.name = "Console Monitor"
         self.path = "/console"
         self.monitor_enabled = False
-        self.console_buffer = []
+        self.console_buffer = deque((), CONSOLE_BUFFER_LINES)
+        self._sse_clients = []
+        self._page_bytes = None  # rendered /console page, built on first request
 
     def get_routes(self):
         return [
             ("/console", self.console_page),
             ("/toggle-monitor", self.toggle_monitor),
-            ("/get-console", self.get_console)
+            ("/get-console", self.get_console),
+            ("/console-stream", self.console_stream)
         ]
 
     def register_routes(self, server):
@@ -23,9 +98,11 @@ class ConsoleMonitorModule(PicowicdModule):
 
     def console_page(self, request):
         """Main console monitor page"""
-        module_html = f'<div class="module">{self.get_html_template()}</div>'
-        full_page = self.foundation.templates.render_page("Console Monitor", module_html)
-        return Response(request, full_page, content_type="text/html")
+        if self._page_bytes is None:
+            module_html = f'<div class="module">{self.get_html_template()}</div>'
+            self._page_bytes = self.foundation.templates.render_page(
+                "Console Monitor", module_html).encode("utf-8")
+        return Response(request, self._page_bytes, content_type="text/html")
 
     def toggle_monitor(self, request):
         """Toggle console monitoring on/off"""
@@ -36,7 +113,9 @@ class ConsoleMonitorModule(PicowicdModule):
                 self.console_print("Console monitoring started")
             else:
                 status = "Monitor is OFF"
-                self.console_buffer = []
+                self._drain_console()
+                for stream in self._sse_clients[:]:
+                    self._close_stream(stream)
             return Response(request, status, content_type="text/plain")
         except Exception as e:
             return Response(request, f"Error: {str(e)}", content_type="text/plain")
@@ -45,66 +124,51 @@ class ConsoleMonitorModule(PicowicdModule):
         """Get console output"""
         try:
             if self.console_buffer:
-                output = "\n".join(self.console_buffer)
-                self.console_buffer = []
+                output = "\n".join(self._drain_console())
                 return Response(request, output, content_type="text/plain")
             else:
-                return Response(request, "No new output", content_type="text/plain")
+                return Response(request, _MSG_NO_OUTPUT, content_type="text/plain")
         except Exception as e:
             return Response(request, f"Error: {str(e)}", content_type="text/plain")
 
+    def console_stream(self, request):
+        """Open a server-sent events stream of console output"""
+        if len(self._sse_clients) >= MAX_STREAM_CLIENTS:
+            self._close_stream(self._sse_clients[0])
+        stream = SSEResponse(request)
+        self._sse_clients.append(stream)
+        return stream
+
+    def _close_stream(self, stream):
+        """Close a console stream and stop sending to it"""
+        self._sse_clients.remove(stream)
+        try:
+            stream.close()
+        except OSError:
+            pass
+
     def console_print(self, message):
-        """Add message to console buffer"""
+        """Send message to open console streams, or buffer it for /get-console"""
         print(f"[Picowicd]: {message}")
         if self.monitor_enabled:
-            self.console_buffer.append(message)
-            if len(self.console_buffer) > 50:
-                self.console_buffer = self.console_buffer[-25:]
-
-    def get_html_template(self):
-        return """
-        <h2>Console Monitor</h2>
-        <a href="/" style="text-decoration: none;"><button>Back to Dashboard</button></a>
+            if not self._sse_clients:
+                self.console_buffer.append(message)
+                return
+            for stream in self._sse_clients[:]:
+                try:
+                    stream.send_event(message)
+                except OSError:
+                    self._close_stream(stream)
 
-        <p>Status: <span id="status">Monitor is OFF</span></p>
+    def _drain_console(self):
+        """Remove and return all buffered console lines, oldest first"""
+        lines = []
+        while self.console_buffer:
+            lines.append(self.console_buffer.popleft())
+        return lines
 
-        <button id="toggle-btn" onclick="toggleMonitor()">Start Monitor</button>
-        <button onclick="getConsole()">Get Output</button>
-
-        <div id="console-area" style="display: none;">
-            <h3>Console Output:</h3>
-            <pre id="console-output" style="background: #f0f0f0; padding: 10px; height: 200px; overflow-y: auto;"></pre>
-        </div>
-
-        <script>
-        function toggleMonitor() {
-            fetch('/toggle-monitor', { method: 'POST' })
-                .then(response => response.text())
-                .then(result => {
-                    document.getElementById('status').textContent = result;
-                    if (result.includes('ON')) {
-                        document.getElementById('toggle-btn').textContent = 'Stop Monitor';
-                        document.getElementById('console-area').style.display = 'block';
-                    } else {
-                        document.getElementById('toggle-btn').textContent = 'Start Monitor';
-                        document.getElementById('console-area').style.display = 'none';
-                    }
-                });
-        }
-
-        function getConsole() {
-            fetch('/get-console', { method: 'POST' })
-                .then(response => response.text())
-                .then(result => {
-                    const output = document.getElementById('console-output');
-                    if (result !== 'No new output') {
-                        output.textContent += result + '\\n';
-                        output.scrollTop = output.scrollHeight;
-                    }
-                });
-        }
-        </script>
-        """
+    def get_html_template(self):
+        return _CONSOLE_HTML
 
     def get_dashboard_html(self):
         """Return HTML for dashboard display"""
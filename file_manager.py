@@ -1,136 +1,22 @@
 from adafruit_httpserver import Response
 import os
+import errno
 from module_base import PicowicdModule
+from foundation_core import decode_html_entities, decode_html_entities_bytes
 
-class FileManagerModule(PicowicdModule):
-    def __init__(self, foundation):
-        super().__init__(foundation)
-        self.name = "File Manager"
-        self.path = "/files"
-
-    def get_routes(self):
-        return [
-            ("/files", self.files_page),
-            ("/list-files", self.list_files),
-            ("/select-file", self.select_file),
-            ("/open-file", self.open_file),
-            ("/save-file", self.save_file),
-            ("/create-file", self.create_file),
-            ("/delete-file", self.delete_file)
-        ]
-
-    def register_routes(self, server):
-        """Register all module routes with the server"""
-        for route, handler in self.get_routes():
-            server.route(route, methods=['GET', 'POST'])(handler)
-
-    def files_page(self, request):
-        module_html = f'<div class="module">{self.get_html_template()}</div>'
-        full_page = self.foundation.templates.render_page("File Manager", module_html)
-        return Response(request, full_page, content_type="text/html")
-
-    def list_files(self, request):
-        files = []
-        try:
-            for file in os.listdir("/"):
-                files.append(file)
-        except OSError:
-            pass
-
-        if files:
-            file_list = "\n".join(files)
-            response_body = f"Files found:\n\n{file_list}"
-        else:
-            response_body = "No files found in CIRCUITPY root directory."
-        return Response(request, response_body, content_type="text/plain")
-
-    def select_file(self, request):
-        try:
-            filename = request.form_data.get('filename', '')
-            if filename:
-                return Response(request, f"Open '{filename}'?", content_type="text/plain")
-            else:
-                return Response(request, "No file selected", content_type="text/plain")
-        except Exception as e:
-            return Response(request, f"Error: {str(e)}", content_type="text/plain")
+# Replies for requests that arrive without a filename, encoded once
+_ERR_NO_FILE_SELECTED = b"No file selected"
+_ERR_NO_FILE_SPECIFIED = b"No file specified"
+_ERR_NO_FILENAME_SAVE = b"No filename specified for saving"
+_ERR_NO_FILENAME = b"No filename specified"
+_MSG_NO_FILES = b"No files found in CIRCUITPY root directory."
 
-    def open_file(self, request):
-        try:
-            filename = request.form_data.get('filename', '')
-            if filename:
-                try:
-                    with open(filename, 'r') as f:
-                        content = f.read()
-                    return Response(request, f"File: {filename}\n\n{content}", content_type="text/plain")
-                except OSError:
-                    return Response(request, f"Error: Could not read file '{filename}'", content_type="text/plain")
-            else:
-                return Response(request, "No file specified", content_type="text/plain")
-        except Exception as e:
-            return Response(request, f"Error: {str(e)}", content_type="text/plain")
+# Lazy directory iterator where the port provides one (MicroPython); CircuitPython
+# builds without it fall back to os.listdir
+_ilistdir = getattr(os, "ilistdir", None)
 
-    def save_file(self, request):
-        try:
-            filename = request.form_data.get('filename', '')
-            content = request.form_data.get('content', '')
-            content = self.decode_html_entities(content)
-
-            if filename:
-                try:
-                    with open(filename, 'w') as f:
-                        f.write(content)
-                    return Response(request, f"File '{filename}' saved successfully!", content_type="text/plain")
-                except OSError as e:
-                    return Response(request, f"Error: Could not save file '{filename}' - {str(e)}", content_type="text/plain")
-            else:
-                return Response(request, "No filename specified for saving", content_type="text/plain")
-        except Exception as e:
-            return Response(request, f"Error: {str(e)}", content_type="text/plain")
-
-    def create_file(self, request):
-        try:
-            filename = request.form_data.get('filename', '')
-            if not filename:
-                return Response(request, "No filename specified", content_type="text/plain")
-
-            try:
-                with open(filename, 'r'):
-                    return Response(request, f"Error: File '{filename}' already exists", content_type="text/plain")
-            except OSError:
-                try:
-                    with open(filename, 'w') as f:
-                        f.write('')
-                    return Response(request, f"File '{filename}' created successfully!", content_type="text/plain")
-                except OSError as e:
-                    return Response(request, f"Error: Could not create file '{filename}' - {str(e)}", content_type="text/plain")
-        except Exception as e:
-            return Response(request, f"Error: {str(e)}", content_type="text/plain")
-
-    def delete_file(self, request):
-        try:
-            filename = request.form_data.get('filename', '')
-            if not filename:
-                return Response(request, "No filename specified", content_type="text/plain")
-
-            try:
-                os.remove(filename)
-                return Response(request, f"File '{filename}' deleted successfully!", content_type="text/plain")
-            except OSError as e:
-                return Response(request, f"Error: Could not delete file '{filename}' - {str(e)}", content_type="text/plain")
-        except Exception as e:
-            return Response(request, f"Error: {str(e)}", content_type="text/plain")
-
-    def decode_html_entities(self, text):
-        """Decode common HTML entities from web form submissions."""
-        text = text.replace('&quot;', '"')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&#39;', "'")
-        return text
-
-    def get_html_template(self):
-        return """
+# File manager page body; static, so the rendered page is built once and cached
+_FILES_HTML = """
         <style>
         /* File Manager Styles */
         .file-list {
@@ -324,6 +210,138 @@ class FileManagerModule(PicowicdModule):
         </script>
         """
 
+def _err_to_response(handler):
+    """Wrap a route handler so unexpected exceptions become a plain-text reply."""
+    def wrapper(self, request):
+        try:
+            return handler(self, request)
+        except Exception as e:
+            return Response(request, "Error: " + str(e), content_type="text/plain")
+    return wrapper
+
+class FileManagerModule(PicowicdModule):
+    # (path, handler method name) pairs, resolved when routes are registered
+    _ROUTES = (
+        ("/files", "files_page"),
+        ("/list-files", "list_files"),
+        ("/select-file", "select_file"),
+        ("/open-file", "open_file"),
+        ("/save-file", "save_file"),
+        ("/create-file", "create_file"),
+        ("/delete-file", "delete_file")
+    )
+    _METHODS = ('GET', 'POST')
+
+    def __init__(self, foundation):
+        super().__init__(foundation)
+        self.name = "File Manager"
+        self.path = "/files"
+        self._page_bytes = None  # rendered /files page, built on first request
+
+    def get_routes(self):
+        return [(route, getattr(self, attr)) for route, attr in self._ROUTES]
+
+    def register_routes(self, server):
+        """Register all module routes with the server"""
+        for route, attr in self._ROUTES:
+            server.route(route, methods=self._METHODS)(getattr(self, attr))
+
+    def files_page(self, request):
+        if self._page_bytes is None:
+            module_html = f'<div class="module">{self.get_html_template()}</div>'
+            self._page_bytes = self.foundation.templates.render_page(
+                "File Manager", module_html).encode("utf-8")
+        return Response(request, self._page_bytes, content_type="text/html")
+
+    def _filename_or_error(self, request, missing=_ERR_NO_FILENAME):
+        """Return (filename, None), or (None, response) when no filename was sent."""
+        filename = request.form_data.get('filename', '')
+        if filename:
+            return filename, None
+        return None, Response(request, missing, content_type="text/plain")
+
+    def list_files(self, request):
+        try:
+            if _ilistdir:
+                files = [entry[0] for entry in _ilistdir("/")]
+            else:
+                files = os.listdir("/")
+        except OSError:
+            files = None
+
+        if not files:
+            return Response(request, _MSG_NO_FILES, content_type="text/plain")
+        return Response(request, "Files found:\n\n" + "\n".join(files), content_type="text/plain")
+
+    @_err_to_response
+    def select_file(self, request):
+        filename, err = self._filename_or_error(request, _ERR_NO_FILE_SELECTED)
+        if err:
+            return err
+        return Response(request, f"Open '{filename}'?", content_type="text/plain")
+
+    @_err_to_response
+    def open_file(self, request):
+        filename, err = self._filename_or_error(request, _ERR_NO_FILE_SPECIFIED)
+        if err:
+            return err
+        try:
+            # One binary read and decode, skipping the text-mode layer
+            with open(filename, 'rb') as f:
+                content = f.read().decode('utf-8')
+            return Response(request, f"File: {filename}\n\n{content}", content_type="text/plain")
+        except OSError:
+            return Response(request, f"Error: Could not read file '{filename}'", content_type="text/plain")
+
+    @_err_to_response
+    def save_file(self, request):
+        filename, err = self._filename_or_error(request, _ERR_NO_FILENAME_SAVE)
+        if err:
+            return err
+        # Encode once, then decode entities on the bytes that get written
+        content = decode_html_entities_bytes(
+            request.form_data.get('content', '').encode('utf-8'))
+
+        try:
+            with open(filename, 'wb') as f:
+                f.write(content)
+            return Response(request, f"File '{filename}' saved successfully!", content_type="text/plain")
+        except OSError as e:
+            return Response(request, f"Error: Could not save file '{filename}' - {e}", content_type="text/plain")
+
+    @_err_to_response
+    def create_file(self, request):
+        filename, err = self._filename_or_error(request)
+        if err:
+            return err
+
+        # Exclusive create: one open that fails if the file already exists
+        try:
+            open(filename, 'x').close()
+            return Response(request, f"File '{filename}' created successfully!", content_type="text/plain")
+        except OSError as e:
+            if e.args and e.args[0] == errno.EEXIST:
+                return Response(request, f"Error: File '{filename}' already exists", content_type="text/plain")
+            return Response(request, f"Error: Could not create file '{filename}' - {e}", content_type="text/plain")
+
+    @_err_to_response
+    def delete_file(self, request):
+        filename, err = self._filename_or_error(request)
+        if err:
+            return err
+
+        try:
+            os.remove(filename)
+            return Response(request, f"File '{filename}' deleted successfully!", content_type="text/plain")
+        except OSError as e:
+            return Response(request, f"Error: Could not delete file '{filename}' - {e}", content_type="text/plain")
+
+    # Shared with the foundation rather than a per-module copy
+    decode_html_entities = staticmethod(decode_html_entities)
+
+    def get_html_template(self):
+        return _FILES_HTML
+
     def get_dashboard_html(self):
         """Return HTML for dashboard display"""
         return f'<a href="{self.path}" style="text-decoration: none;"><button style="width: 100%; margin: 5px 0;">Open {self.name}</button></a>'
\ No newline at end of file
@@ -8,10 +8,176 @@ import wifi
 import socketpool
 import ipaddress
 import time
-import os
 import microcontroller
-from adafruit_httpserver import Server, Request, Response
+import board
+import busio
 import gc
+from module_base import PicowicdModule
+
+# Entities decoded from form input, keyed by the text between '&' and ';'
+_HTML_ENTITIES = {"quot": '"', "amp": "&", "lt": "<", "gt": ">", "#39": "'"}
+# Furthest a ';' can be from its '&' and still close a known entity
+_ENTITY_SPAN = max(len(name) for name in _HTML_ENTITIES) + 2
+
+def decode_html_entities(text):
+    """
+    Decode the HTML entities browsers put in form submissions.
+    
+    Single forward pass: each '&' is looked up once and its output is
+    never rescanned, so "&amp;quot;" decodes to "&quot;".
+    """
+    idx = text.find('&')
+    # Every entity starts with '&'; most input has none, so skip the copies
+    if idx < 0:
+        return text
+    parts = []
+    prev = 0
+    while idx >= 0:
+        end = text.find(';', idx + 1, idx + _ENTITY_SPAN)
+        char = _HTML_ENTITIES.get(text[idx + 1:end]) if end > 0 else None
+        if char is None:
+            idx = text.find('&', idx + 1)
+            continue
+        parts.append(text[prev:idx])
+        parts.append(char)
+        prev = end + 1
+        idx = text.find('&', prev)
+    parts.append(text[prev:])
+    return "".join(parts)
+
+# Byte-string counterpart of _HTML_ENTITIES for decode_html_entities_bytes
+_HTML_ENTITIES_BYTES = {name.encode(): char.encode() for name, char in _HTML_ENTITIES.items()}
+
+def decode_html_entities_bytes(data):
+    """
+    Decode HTML entities in UTF-8 bytes, same rules as decode_html_entities.
+    
+    Returns the input unchanged when it has no '&', otherwise a bytearray
+    assembled from memoryview slices so the bulk text is copied only once.
+    """
+    idx = data.find(b'&')
+    if idx < 0:
+        return data
+    view = memoryview(data)
+    out = bytearray()
+    prev = 0
+    while idx >= 0:
+        end = data.find(b';', idx + 1, idx + _ENTITY_SPAN)
+        char = _HTML_ENTITIES_BYTES.get(bytes(view[idx + 1:end])) if end > 0 else None
+        if char is None:
+            idx = data.find(b'&', idx + 1)
+            continue
+        out.extend(view[prev:idx])
+        out.extend(char)
+        prev = end + 1
+        idx = data.find(b'&', prev)
+    out.extend(view[prev:])
+    return out
+
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))  # settings.toml values read as enabled
+
+# Single-character escapes accepted in settings.toml basic strings, as by
+# CircuitPython's os.getenv
+_TOML_ESCAPES = {'"': '"', "\\": "\\", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+def _toml_string(value):
+    """
+    Decode the basic string starting at value[0] == '"' in one left-to-right pass.
+    
+    A backslash always consumes the character after it, so an escaped
+    backslash before the closing quote cannot hide that quote. Handles the
+    escapes in _TOML_ESCAPES plus \\uXXXX and \\UXXXXXXXX; anything after the
+    closing quote (such as a comment) is ignored. An unknown escape is kept
+    as written.
+    """
+    out = []
+    i = 1
+    n = len(value)
+    while i < n:
+        c = value[i]
+        if c == '"':
+            break
+        if c == "\\" and i + 1 < n:
+            e = value[i + 1]
+            if e in _TOML_ESCAPES:
+                out.append(_TOML_ESCAPES[e])
+                i += 2
+                continue
+            width = 4 if e == "u" else 8 if e == "U" else 0
+            digits = value[i + 2:i + 2 + width]
+            if width and len(digits) == width:
+                try:
+                    out.append(chr(int(digits, 16)))
+                    i += 2 + width
+                    continue
+                except ValueError:
+                    pass
+            out.append(c + e)
+            i += 2
+            continue
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+def _read_settings_toml(path="/settings.toml"):
+    """
+    Parse the top-level ``key = value`` lines of settings.toml in one read.
+    
+    Quoted strings are decoded with _toml_string; other values are returned
+    as their raw text. Parsing stops at the first ``[table]`` header, since
+    CircuitPython's getenv only reads keys above it. Returns an empty dict
+    if the file is missing.
+    """
+    settings = {}
+    try:
+        with open(path, "r") as f:
+            lines = f.read().split("\n")
+    except OSError:
+        return settings
+    for line in lines:
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        if line[0] == "[":
+            break
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        value = value.strip()
+        if value[:1] == '"':
+            value = _toml_string(value)
+        else:
+            value = value.split("#", 1)[0].strip()
+        settings[key.strip()] = value
+    return settings
+
+# Last good access point, kept in microcontroller.nvm so the next boot can
+# connect straight to it: magic, SSID length, SSID (32), BSSID (6), channel
+_NVM_WIFI_MAGIC = 0xA5
+_NVM_WIFI_SIZE = 41
+_FAST_CONNECT_TIMEOUT = 5  # seconds to try the cached access point
+
+STARTUP_LOG_LINES = 64   # startup_log keeps only the most recent messages
+STARTUP_LOG_WIDTH = 240  # longer messages are truncated before logging (fits merged entries)
+
+GC_INTERVAL = 1.0     # minimum seconds between post-request collections in run_main_loop
+GC_LOW_MEMORY = 8192  # collect early when free heap drops below this
+
+# Node status page, minified; only the volatile fields are filled in per render
+_DASHBOARD_TMPL = (
+    '<!DOCTYPE html><html><head><title>{title}</title>'
+    '<style>body{{font-family:Arial,sans-serif;margin:20px}}'
+    '.status{{background:#f0f0f0;padding:10px;border-radius:5px}}</style>'
+    '</head><body><h1>{title}</h1><div class="status">'
+    '<p><strong>Node Type:</strong> wicdpico-node</p>'
+    '<p><strong>WiFi Mode:</strong> {wifi_mode}</p>'
+    '<p><strong>WiFi SSID:</strong> {ssid}</p>'
+    '<p><strong>Network:</strong> http://{ip}</p>'
+    '<p><strong>Modules loaded:</strong> {modules}</p>'
+    '<p><strong>Config status:</strong> {config}</p>'
+    '<p><strong>Debug mode:</strong> {debug}</p>'
+    '</div></body></html>'
+)
 
 class Config:
     """Configuration container with node defaults."""
@@ -20,6 +186,9 @@ class Config:
     WIFI_MODE = "CLIENT"  # Locked to CLIENT mode
     BLINK_INTERVAL = 0.25
     DEBUG_MODE = False  # Debug mode flag
+    LOOP_ACTIVE_SLEEP = 0.005  # main loop sleep while a request burst is in progress
+    LOOP_IDLE_SLEEP = 0.1      # main loop sleep once the node has gone idle
+    LOOP_ACTIVE_WINDOW = 1.0   # seconds after a handled request that count as active
 
 class PicowicdFoundation:
     """
@@ -33,43 +202,146 @@ class PicowicdFoundation:
         """Initialize foundation system with node configuration."""
         self.config = Config()
         self.startup_log = []
+        self._boot_phase = True  # startup_print echoes to serial until the server starts
         self.server = None
+        self.socket_pool = None  # Shared by the HTTP server and network modules
+        self.cached_ip = None    # str of wifi.radio.ipv4_address, set on connect
+        self._i2c = None  # Shared I2C bus, created on first get_i2c()
+        self._status_cache = None     # last /status body, as bytes
+        self._last_status_key = None  # state the cached body was built from
+        self._active_until = 0        # main loop polls fast until this time
+        self._dashboard_cache = None  # last render_dashboard() output
+        self._dashboard_key = None    # state the cached dashboard was built from
+        self._dashboard_bytes = None  # UTF-8 encoding of _dashboard_cache
         self.modules = {}
+        self._tick_updates = []  # bound update() of modules run every tick (no-ops skipped)
+        self._scheduled = []     # [next_due, update, update_delay] entries for interval modules
         self.config_failed = False
         self.wifi_mode = "CLIENT"  # Always CLIENT mode
 
-    def startup_print(self, message):
-        """Print startup message only if debug mode enabled."""
-        if self.config.DEBUG_MODE:
-            print(f"[STARTUP] {message}")
-        self.startup_log.append(message)
+    def startup_print(self, message, *args):
+        """
+        Log a startup message, printing it only if debug mode enabled.
+        
+        Extra arguments are %-formatted into the message. The log keeps the
+        last STARTUP_LOG_LINES messages, each cut to STARTUP_LOG_WIDTH
+        characters; the printed copy is not truncated. Once start_server()
+        has run, messages only go to the log (served at /log) so the main
+        loop never blocks on the serial console.
+        """
+        if args:
+            message = message % args
+        # Bounded so a long-running node's log cannot grow without limit
+        log = self.startup_log
+        log.append(message[:STARTUP_LOG_WIDTH])
+        if len(log) > STARTUP_LOG_LINES:
+            del log[0]
+        if self._boot_phase and self.config.DEBUG_MODE:
+            print("[STARTUP]", message)
 
-    def debug_print(self, message):
-        """Print debug message if debug mode enabled."""
+    def debug_print(self, message, *args):
+        """
+        Print debug message if debug mode enabled.
+        
+        Extra arguments are %-formatted into the message, which is skipped
+        entirely in silent mode.
+        """
         if self.config.DEBUG_MODE:
-            print(f"[DEBUG] {message}")
+            print("[DEBUG]", message % args if args else message)
 
     def decode_html_entities(self, text):
         """Clean web form input of HTML entities."""
-        text = text.replace('&quot;', '"')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&#39;', "'")
-        return text
+        return decode_html_entities(text)
+
+    def decode_html_entities_bytes(self, data):
+        """Clean encoded web form input of HTML entities."""
+        return decode_html_entities_bytes(data)
+
+    def get_i2c(self):
+        """Return the shared I2C bus (GP5=SCL, GP4=SDA), creating it on first use."""
+        if self._i2c is None:
+            self._i2c = busio.I2C(board.GP5, board.GP4)
+            self.startup_print("I2C bus initialized (GP5=SCL, GP4=SDA)")
+        return self._i2c
+
+    def cleanup(self):
+        """Run module cleanup and release shared hardware on shutdown."""
+        for module in self.modules.values():
+            try:
+                module.cleanup()
+            except Exception as e:
+                self.debug_print("Cleanup failed: %s", e)
+        if self._i2c is not None:
+            self._i2c.deinit()
+            self._i2c = None
+
+    def set_debug_mode(self, enabled):
+        """Toggle DEBUG_MODE at runtime and pass it to modules that cache it."""
+        self.config.DEBUG_MODE = enabled
+        for module in self.modules.values():
+            if hasattr(module, "set_debug"):
+                module.set_debug(enabled)
 
     def get_module(self, name):
         """Get registered module by name."""
         return self.modules.get(name)
 
+    def _load_wifi_hint(self, ssid):
+        """Return (bssid, channel) saved for ssid in NVM, or None."""
+        nvm = microcontroller.nvm
+        if not nvm or len(nvm) < _NVM_WIFI_SIZE:
+            return None
+        data = nvm[0:_NVM_WIFI_SIZE]
+        length = data[1]
+        if data[0] != _NVM_WIFI_MAGIC or length > 32 or bytes(data[2:2 + length]) != ssid.encode():
+            return None
+        return bytes(data[34:40]), data[40]
+
+    def _save_wifi_hint(self, ssid):
+        """Store the connected access point's BSSID and channel in NVM if changed."""
+        nvm = microcontroller.nvm
+        name = ssid.encode()
+        ap = wifi.radio.ap_info
+        if not nvm or len(nvm) < _NVM_WIFI_SIZE or len(name) > 32 or ap is None:
+            return
+        data = bytearray(_NVM_WIFI_SIZE)
+        data[0] = _NVM_WIFI_MAGIC
+        data[1] = len(name)
+        data[2:2 + len(name)] = name
+        data[34:40] = bytes(ap.bssid)
+        data[40] = ap.channel
+        # Only rewrite flash when the access point actually changed
+        if nvm[0:_NVM_WIFI_SIZE] != data:
+            nvm[0:_NVM_WIFI_SIZE] = data
+
     def safe_connect_client(self, ssid, password):
-        """Connect to existing WiFi network with timeout."""
+        """
+        Connect to existing WiFi network with timeout.
+        
+        The access point from the last successful connection (saved in NVM)
+        is tried first with a short timeout, skipping the scan; on failure
+        the normal connect runs and the saved access point is refreshed.
+        """
         try:
             self.startup_print(f"Connecting to WiFi: {ssid}")
-            wifi.radio.connect(ssid, password, timeout=30)
+            hint = self._load_wifi_hint(ssid)
+            if hint:
+                try:
+                    wifi.radio.connect(ssid, password, bssid=hint[0], channel=hint[1],
+                                       timeout=_FAST_CONNECT_TIMEOUT)
+                except Exception as e:
+                    self.debug_print("Cached access point failed: %s", e)
+            
+            if not wifi.radio.connected:
+                wifi.radio.connect(ssid, password, timeout=30)
             
             if wifi.radio.connected:
-                self.startup_print(f"Connected successfully: {wifi.radio.ipv4_address}")
+                self.cached_ip = str(wifi.radio.ipv4_address)
+                self.startup_print(f"Connected successfully: {self.cached_ip}")
+                try:
+                    self._save_wifi_hint(ssid)
+                except Exception as e:
+                    self.debug_print("Could not save access point: %s", e)
                 return True, ssid, password
             else:
                 self.startup_print("Connection failed - no connection established")
@@ -82,25 +354,38 @@ class PicowicdFoundation:
     def load_user_config(self):
         """Load config from settings.toml with debug mode support."""
         try:
+            # Read settings.toml once instead of a file scan per os.getenv()
+            settings = _read_settings_toml()
+            
             # Must load debug mode first before any startup_print calls
-            toml_debug = os.getenv("DEBUG_MODE")
+            toml_debug = settings.get("DEBUG_MODE")
             if toml_debug:
                 try:
-                    self.config.DEBUG_MODE = str(toml_debug).lower() in ['true', '1', 'yes', 'on']
+                    self.config.DEBUG_MODE = str(toml_debug).lower() in _TRUTHY
                 except:
                     self.config.DEBUG_MODE = False
             
-            self.startup_print("Loading user config...")
+            # Optional main loop timing overrides, honoured with either config source.
+            # A bad value keeps the Config default; it must not trigger emergency defaults
+            for key in ("LOOP_ACTIVE_SLEEP", "LOOP_IDLE_SLEEP", "LOOP_ACTIVE_WINDOW"):
+                value = settings.get(key)
+                if value:
+                    try:
+                        seconds = float(value)
+                    except (TypeError, ValueError):
+                        seconds = 0
+                    if seconds > 0:
+                        setattr(self.config, key, seconds)
+                    else:
+                        self.debug_print("Ignoring %s = %r, keeping %s", key, value, getattr(self.config, key))
 
             # Try settings.toml first (modern approach)
-            toml_ssid = os.getenv("WIFI_SSID")
-            toml_password = os.getenv("WIFI_PASSWORD")
-            toml_blink = os.getenv("BLINK_INTERVAL")
+            toml_ssid = settings.get("WIFI_SSID")
+            toml_password = settings.get("WIFI_PASSWORD")
+            toml_blink = settings.get("BLINK_INTERVAL")
 
             # If core WiFi settings found in TOML, use TOML approach
             if toml_ssid and toml_password:
-                self.startup_print("Found settings.toml, using TOML configuration")
-
                 try:
                     self.config.WIFI_SSID = self.decode_html_entities(str(toml_ssid))
                 except:
@@ -117,11 +402,13 @@ class PicowicdFoundation:
                     except:
                         self.config_failed = True
 
-                self.startup_print(f"Debug mode: {'ON' if self.config.DEBUG_MODE else 'OFF'}")
+                # One log entry for the whole TOML load
+                self.startup_print("Loading user config...\nFound settings.toml, using TOML configuration\n"
+                                   "Debug mode: %s", 'ON' if self.config.DEBUG_MODE else 'OFF')
                 return
 
             # Fall back to config.py
-            self.startup_print("No complete settings.toml found, trying config.py")
+            self.startup_print("Loading user config...\nNo complete settings.toml found, trying config.py")
             import config as user_config
 
             try:
@@ -175,12 +462,15 @@ class PicowicdFoundation:
         self.config.WIFI_PASSWORD = password
         
         if client_success:
-            # Create server using client IP
-            pool = socketpool.SocketPool(wifi.radio)
-            self.server = Server(pool, "/", debug=False)
-            server_ip = str(wifi.radio.ipv4_address)
+            # Create server using client IP; the HTTP library is only loaded
+            # once there is a network to serve on, then its load garbage freed
+            from adafruit_httpserver import Server
+            gc.collect()
+            self.socket_pool = socketpool.SocketPool(wifi.radio)
+            self.server = Server(self.socket_pool, "/", debug=False)
+            server_ip = self.cached_ip
             self.startup_print(f"Node server IP: {server_ip}")
-            self.debug_print(f"Server initialized on {server_ip}")
+            self.debug_print("Server initialized on %s", server_ip)
             return True
         else:
             self.startup_print("CLIENT connection failed - node cannot operate")
@@ -190,83 +480,189 @@ class PicowicdFoundation:
     def register_module(self, name, module):
         """Register a module with the foundation system."""
         self.modules[name] = module
+        if getattr(module, "read_interval", 0) > 0:
+            self._scheduled.append([time.monotonic(), module.update, module.update_delay])
+        elif getattr(type(module), "update", None) is not PicowicdModule.update:
+            # Modules that keep the base no-op update() are never called
+            self._tick_updates.append(module.update)
         module.register_routes(self.server)
-        self.debug_print(f"Module registered: {name}")
+        self.debug_print("Module registered: %s", name)
+
+    def update_modules(self, now=None):
+        """
+        Run module updates that are due.
+        
+        Modules without a read_interval are updated on every call; interval
+        modules only once their next due time has passed, after which they
+        are rescheduled using their update_delay(). Every module receives
+        the same ``now`` so the clock is read once per pass.
+        """
+        if now is None:
+            now = time.monotonic()
+        # Bound methods are resolved once at registration, not per call
+        for update in self._tick_updates:
+            update(now)
+        for entry in self._scheduled:
+            if now >= entry[0]:
+                entry[1](now)
+                entry[0] = now + entry[2]()
 
     def start_server(self):
         """Start minimal web server for node status."""
+        from adafruit_httpserver import Request, Response
+        
         # Simple status route only
         @self.server.route("/status", methods=['GET'])
         def node_status(request: Request):
             """Basic node status endpoint."""
             try:
-                status = {
-                    "node_type": "wicdpico-node",
-                    "wifi_mode": "CLIENT",
-                    "connected": wifi.radio.connected,
-                    "ip": str(wifi.radio.ipv4_address) if wifi.radio.connected else "none",
-                    "modules": list(self.modules.keys()),
-                    "config_ok": not self.config_failed,
-                    "debug_mode": self.config.DEBUG_MODE
-                }
+                # Rebuild the body only when the state it shows has changed
+                connected = wifi.radio.connected
+                key = (connected, len(self.modules), self.config.DEBUG_MODE, self.config_failed)
+                if key == self._last_status_key:
+                    return Response(request, self._status_cache, content_type="text/html")
                 
-                status_text = f"Node Status: {status['node_type']}<br>"
-                status_text += f"Mode: {status['wifi_mode']}<br>"
-                status_text += f"Connected: {status['connected']}<br>"
-                status_text += f"IP: {status['ip']}<br>"
-                status_text += f"Modules: {len(status['modules'])}<br>"
-                status_text += f"Config: {'OK' if status['config_ok'] else 'Failed'}<br>"
-                status_text += f"Debug: {'ON' if status['debug_mode'] else 'OFF'}"
+                # One join and one encode; the cached bytes are sent as is
+                status_text = "<br>".join((
+                    "Node Status: wicdpico-node",
+                    "Mode: CLIENT",
+                    f"Connected: {connected}",
+                    "IP: " + ((self.cached_ip or "none") if connected else "none"),
+                    f"Modules: {len(self.modules)}",
+                    "Config: " + ("Failed" if self.config_failed else "OK"),
+                    "Debug: " + ("ON" if self.config.DEBUG_MODE else "OFF")
+                )).encode("utf-8")
                 
+                self._status_cache = status_text
+                self._last_status_key = key
                 return Response(request, status_text, content_type="text/html")
                 
             except Exception as e:
                 return Response(request, f"Status error: {e}", content_type="text/plain")
         
-        server_ip = str(wifi.radio.ipv4_address)
+        @self.server.route("/log", methods=['GET'])
+        def startup_log(request: Request):
+            """Recent startup_print messages, oldest first."""
+            return Response(request, "\n".join(self.startup_log), content_type="text/plain")
+        
+        server_ip = self.cached_ip
         self.server.start(server_ip, port=80)
         self.startup_print(f"Node status at http://{server_ip}/status")
         self.debug_print("HTTP server started")
+        self._boot_phase = False
+
+    def _refresh_ip_if_changed(self):
+        """
+        Re-read the radio address and drop cached pages if it changed.
+        
+        A momentarily missing address (e.g. during DHCP renewal) keeps the
+        last good IP rather than clearing it.
+        """
+        address = wifi.radio.ipv4_address
+        if not address:
+            return
+        ip = str(address)
+        if ip != self.cached_ip:
+            self.cached_ip = ip
+            self._last_status_key = None
+            self._dashboard_key = None
+            self.debug_print("IP address changed: %s", ip)
+
+    def _make_server_poller(self):
+        """
+        Return a select.poll() object watching the server's listening socket.
+        
+        Returns None when the port has no select module or its sockets
+        cannot be polled, so the caller falls back to sleeping.
+        """
+        try:
+            import select
+            poller = select.poll()
+            poller.register(self.server._sock, select.POLLIN)
+            poller.poll(0)  # probe: some builds only fail once polled
+            return poller
+        except Exception as e:
+            self.debug_print("Socket polling unavailable, using sleep: %s", e)
+            return None
 
     def run_main_loop(self):
-        """Main polling loop with module updates."""
+        """
+        Main polling loop with module updates.
+        
+        Garbage is collected when free heap drops below GC_LOW_MEMORY, or
+        after a handled request (web responses are the main allocators) at
+        most once per GC_INTERVAL; idle ticks never collect. Where the port
+        has gc.threshold() the runtime is also asked to collect on its own.
+        
+        Sleep adapts to activity: for LOOP_ACTIVE_WINDOW seconds after a
+        handled request the loop sleeps LOOP_ACTIVE_SLEEP so follow-up
+        requests are picked up promptly, then falls back to LOOP_IDLE_SLEEP.
+        Where the listening socket can be polled, the wait is a select
+        poll() with that timeout, so a new connection ends it immediately.
+        """
+        from adafruit_httpserver import NO_REQUEST
+        
+        config = self.config
+        poll = self.server.poll
+        update_modules = self.update_modules
+        poller = self._make_server_poller()
+        threshold = getattr(gc, "threshold", None)
+        if threshold:
+            threshold(gc.mem_free() // 4)
+        next_gc = time.monotonic() + GC_INTERVAL
+        next_ip_check = next_gc
         while True:
-            self.server.poll()
+            handled = poll() != NO_REQUEST
 
-            # Update all modules
-            for module in self.modules.values():
-                module.update()
+            # Update modules that are due
+            now = time.monotonic()
+            if handled:
+                self._active_until = now + config.LOOP_ACTIVE_WINDOW
+            update_modules(now)
 
-            time.sleep(0.1)
-            gc.collect()
+            if (handled and now >= next_gc) or gc.mem_free() < GC_LOW_MEMORY:
+                gc.collect()
+                next_gc = now + GC_INTERVAL
+
+            if now < self._active_until:
+                wait = config.LOOP_ACTIVE_SLEEP
+            else:
+                wait = config.LOOP_IDLE_SLEEP
+                # Idle ticks check for a new DHCP address about once a second
+                if now >= next_ip_check:
+                    self._refresh_ip_if_changed()
+                    next_ip_check = now + 1.0
+            if poller:
+                poller.poll(int(wait * 1000))
+            else:
+                time.sleep(wait)
 
     def render_dashboard(self, title="Node Status"):
-        """Minimal status page for nodes."""
-        system_info = f"""
-            <p><strong>Node Type:</strong> wicdpico-node</p>
-            <p><strong>WiFi Mode:</strong> {self.wifi_mode}</p>
-            <p><strong>WiFi SSID:</strong> {self.config.WIFI_SSID}</p>
-            <p><strong>Network:</strong> http://{wifi.radio.ipv4_address}</p>
-            <p><strong>Modules loaded:</strong> {len(self.modules)}</p>
-            <p><strong>Config status:</strong> {'Failed' if self.config_failed else 'OK'}</p>
-            <p><strong>Debug mode:</strong> {'ON' if self.config.DEBUG_MODE else 'OFF'}</p>
         """
+        Minimal status page for nodes.
+        
+        The page is cached and only re-formatted when the title or the
+        state it shows changes, as for the /status body.
+        """
+        key = (title, wifi.radio.connected, len(self.modules),
+               self.config.DEBUG_MODE, self.config_failed)
+        if key == self._dashboard_key:
+            return self._dashboard_cache
+        self._dashboard_key = key
+        self._dashboard_bytes = None
+        self._dashboard_cache = _DASHBOARD_TMPL.format(
+            title=title,
+            wifi_mode=self.wifi_mode,
+            ssid=self.config.WIFI_SSID,
+            ip=self.cached_ip,
+            modules=len(self.modules),
+            config='Failed' if self.config_failed else 'OK',
+            debug='ON' if self.config.DEBUG_MODE else 'OFF')
+        return self._dashboard_cache
 
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>{title}</title>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                .status {{ background: #f0f0f0; padding: 10px; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <h1>{title}</h1>
-            <div class="status">
-                {system_info}
-            </div>
-        </body>
-        </html>
-        """
\ No newline at end of file
+    def render_dashboard_bytes(self, title="Node Status"):
+        """render_dashboard() pre-encoded for a Response, encoded once per rebuild."""
+        html = self.render_dashboard(title)
+        if self._dashboard_bytes is None:
+            self._dashboard_bytes = html.encode("utf-8")
+        return self._dashboard_bytes
\ No newline at end of file
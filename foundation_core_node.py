@@ -12,6 +12,8 @@ import ipaddress
 import time
 import os
 import microcontroller
+import board
+import busio
 from adafruit_httpserver import Server, Request, Response
 import gc
 
@@ -37,12 +39,16 @@ class PicowicdFoundation:
         self.config = Config()
         self.startup_log = []
         self.server = None
+        self.socket_pool = None  # Shared by the HTTP server and network modules
         self.modules = {}
         self.config_failed = False
         self.wifi_mode = "CLIENT"  # Always CLIENT mode
+        self._i2c = None  # shared I2C bus, created on first get_i2c()
 
-    def startup_print(self, message):
-        """Dual console/web logging for debugging."""
+    def startup_print(self, message, *args):
+        """Dual console/web logging for debugging; extra arguments are %-formatted in."""
+        if args:
+            message = message % args
         print(message)
         self.startup_log.append(message)
 
@@ -55,6 +61,24 @@ class PicowicdFoundation:
         text = text.replace('&#39;', "'")
         return text
 
+    def get_i2c(self):
+        """Return the shared I2C bus (GP5=SCL, GP4=SDA), creating it on first use."""
+        if self._i2c is None:
+            self._i2c = busio.I2C(board.GP5, board.GP4)
+            self.startup_print("I2C bus initialized (GP5=SCL, GP4=SDA)")
+        return self._i2c
+
+    def cleanup(self):
+        """Run module cleanup and release shared hardware on shutdown."""
+        for module in self.modules.values():
+            try:
+                module.cleanup()
+            except Exception as e:
+                self.startup_print(f"Cleanup failed: {e}")
+        if self._i2c is not None:
+            self._i2c.deinit()
+            self._i2c = None
+
     def get_module(self, name):
         """Get registered module by name."""
         return self.modules.get(name)
@@ -155,8 +179,8 @@ class PicowicdFoundation:
         
         if client_success:
             # Create server using client IP
-            pool = socketpool.SocketPool(wifi.radio)
-            self.server = Server(pool, "/", debug=False)
+            self.socket_pool = socketpool.SocketPool(wifi.radio)
+            self.server = Server(self.socket_pool, "/", debug=False)
             server_ip = str(wifi.radio.ipv4_address)
             self.startup_print(f"Node server IP: {server_ip}")
             return True
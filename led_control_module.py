@@ -29,13 +29,18 @@ class LEDControlModule(PicowicdModule):
         self.led.direction = digitalio.Direction.OUTPUT
 
         # LED state management
-        self.last_blink = time.monotonic()
         self.led_state = False
         self.blinky_enabled = False
         self.manual_mode = False
 
-        # Get blink interval from config
+        # Get blink interval from config; the foundation scheduler calls
+        # update() once per interval instead of on every main-loop tick
         self.blink_interval = foundation.config.BLINK_INTERVAL
+        self.read_interval = self.blink_interval
+
+        # Next toggle as an absolute deadline, compared against the main
+        # loop's shared clock reading
+        self._next_blink = time.monotonic()
         
         self.foundation.startup_print("LED control initialized for node")
 
@@ -49,6 +54,7 @@ class LEDControlModule(PicowicdModule):
         self.blinky_enabled = enabled
         if enabled:
             self.manual_mode = False
+            self._next_blink = time.monotonic()
         else:
             self.set_led(False)
 
@@ -60,14 +66,16 @@ class LEDControlModule(PicowicdModule):
         """No dashboard for node version."""
         return ""
 
-    def update(self):
+    def update(self, now=None):
         """Handle blinky timing - called from main loop."""
         if not self.blinky_enabled or self.manual_mode:
             return
 
-        current_time = time.monotonic()
+        if now is None:
+            now = time.monotonic()
+        if now < self._next_blink:
+            return
 
-        if current_time - self.last_blink >= self.blink_interval:
-            self.led_state = not self.led_state
-            self.led.value = self.led_state
-            self.last_blink = current_time
\ No newline at end of file
+        self.led_state = not self.led_state
+        self.led.value = self.led_state
+        self._next_blink = now + self.blink_interval
\ No newline at end of file
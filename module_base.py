@@ -33,7 +33,7 @@ Usage Pattern
         def get_dashboard_html(self):
             return "<button onclick='myFunction()'>My Button</button>"
         
-        def update(self):
+        def update(self, now=None):
             # Called from main loop
             pass
 
@@ -83,6 +83,9 @@ class PicowicdModule:
         foundation.register_module("custom", module)
     """
     
+    # Seconds between update() calls this module needs; 0 runs it every tick
+    read_interval = 0
+    
     def __init__(self, foundation):
         """
         Initialize base module with foundation integration.
@@ -149,7 +152,7 @@ class PicowicdModule:
         """
         return ""
         
-    def update(self):
+    def update(self, now=None):
         """
         Called from main loop for real-time updates.
         
@@ -157,25 +160,45 @@ class PicowicdModule:
         or state updates. Called continuously by the foundation main loop,
         so avoid blocking operations.
         
+        :param now: ``time.monotonic()`` read once per main-loop pass and
+            shared by all modules; ``None`` when called directly
+        :type now: float or None
+        
         **Implementation Guidelines:**
         
         * Keep execution time minimal (< 10ms typical)
         * Use non-blocking operations only
         * Handle exceptions gracefully
         * Use time-based intervals for periodic tasks
+        * Set ``read_interval`` to let the foundation skip calls between intervals
         
         **Example Implementation:**
         
         .. code-block:: python
         
-            def update(self):
-                current_time = time.monotonic()
-                if current_time - self.last_reading > self.read_interval:
+            def update(self, now=None):
+                if now is None:
+                    now = time.monotonic()
+                if now - self.last_reading > self.read_interval:
                     self.read_sensors()
-                    self.last_reading = current_time
+                    self.last_reading = now
         """
         pass
         
+    def update_delay(self):
+        """
+        Seconds until update() next needs to be called.
+        
+        Used by the foundation scheduler after each scheduled update().
+        Defaults to ``read_interval``; override when a module occasionally
+        needs a sooner follow-up call (for example to collect a sensor
+        conversion it started).
+        
+        :return: Delay in seconds
+        :rtype: float
+        """
+        return self.read_interval
+        
     def cleanup(self):
         """
         Shutdown procedures.
@@ -28,6 +28,9 @@ The module publishes sensor data to a hierarchical topic structure:
 * ``wcs/{node_id}/battery`` - Battery voltage (V)
 * ``wcs/{node_id}/status`` - Node status and JSON data
 
+With ``MQTT_BATCH_PUBLISH = "1"`` all readings are sent as one compact JSON
+message on the status topic instead of one publish per topic.
+
 Configuration (settings.toml)
 ----------------------------
 .. code-block:: toml
@@ -39,6 +42,8 @@ Configuration (settings.toml)
     MQTT_NODE_ID = "node01"
     MQTT_PUBLISH_INTERVAL = "30"
     MQTT_TOPIC_BASE = "wcs"
+    MQTT_BATCH_PUBLISH = "0"
+    MQTT_DEBUG = "0"
 
 Basic Usage Example
 ------------------
@@ -71,6 +76,7 @@ Integration Example
 """
 import time
 import os
+import json
 import wifi
 import socketpool
 import ssl
@@ -78,6 +84,119 @@ import adafruit_minimqtt.adafruit_minimqtt as MQTT
 from module_base import PicowicdModule
 from adafruit_httpserver import Request, Response
 
+# Publish-on-change thresholds: a value is only re-sent once it moves at
+# least this far from the last published value
+PUBLISH_THRESHOLDS = {
+    "temperature": 0.05,      # °C
+    "humidity": 0.2,          # %RH
+    "battery_voltage": 0.05   # V
+}
+STATUS_HEARTBEAT_INTERVALS = 5  # publish status at least every N intervals
+
+# Reconnect backoff bounds in seconds: doubled after each failed attempt
+RECONNECT_BACKOFF_MIN = 30
+RECONNECT_BACKOFF_MAX = 600
+
+_TRUTHY = frozenset(('true', '1', 'yes', 'on'))  # settings.toml values read as enabled
+
+# settings.toml values are fixed for the life of the process, so each key is
+# read through os.getenv at most once
+_ENV_CACHE = {}
+
+
+def _cached_getenv(key, default=None):
+    """
+    Return a settings.toml value, reading it from the environment only once.
+
+    :param key: Setting name
+    :type key: str
+    :param default: Value returned when the setting is absent
+    :return: Setting value or default
+    """
+    try:
+        return _ENV_CACHE[key]
+    except KeyError:
+        value = os.getenv(key, default)
+        _ENV_CACHE[key] = value
+        return value
+
+
+# Dashboard widget markup: the dynamic status block is filled in with %
+# formatting, the control script is a fixed string and never re-formatted
+_DASHBOARD_HEAD = '''
+        <div class="module">
+            <h3>MQTT Client - %s</h3>
+            
+            <div class="status" style="border-left: 4px solid %s;">
+                <strong>Status:</strong> %s<br>
+                <strong>Message:</strong> %s<br>
+                <strong>Attempts:</strong> %s<br>
+                <strong>Last Published:</strong> %s
+            </div>
+            
+            <div class="control-group">
+                <button id="mqtt-connect-btn" onclick="mqttConnect()">Connect</button>
+                <button id="mqtt-disconnect-btn" onclick="mqttDisconnect()">Disconnect</button>
+                <button id="mqtt-publish-btn" onclick="mqttPublish()">Test Publish</button>
+            </div>
+            
+            <div id="mqtt-status" class="status">
+                Ready for MQTT operations
+            </div>
+            
+            '''
+
+_DASHBOARD_JS = '''
+        </div>
+
+        <script>
+        function mqttConnect() {
+            setButtonLoading('mqtt-connect-btn', true);
+            serverRequest('/mqtt?action=connect')
+                .then(result => {
+                    updateElement('mqtt-status', 'Status: ' + result);
+                    setTimeout(() => location.reload(), 1000); // Refresh to show new status
+                })
+                .catch(error => {
+                    updateElement('mqtt-status', 'Error: ' + error.message);
+                })
+                .finally(() => {
+                    setButtonLoading('mqtt-connect-btn', false);
+                });
+        }
+
+        function mqttDisconnect() {
+            setButtonLoading('mqtt-disconnect-btn', true);
+            serverRequest('/mqtt?action=disconnect')
+                .then(result => {
+                    updateElement('mqtt-status', 'Status: ' + result);
+                    setTimeout(() => location.reload(), 1000); // Refresh to show new status
+                })
+                .catch(error => {
+                    updateElement('mqtt-status', 'Error: ' + error.message);
+                })
+                .finally(() => {
+                    setButtonLoading('mqtt-disconnect-btn', false);
+                });
+        }
+
+        function mqttPublish() {
+            setButtonLoading('mqtt-publish-btn', true);
+            serverRequest('/mqtt?action=publish')
+                .then(result => {
+                    updateElement('mqtt-status', 'Status: ' + result);
+                })
+                .catch(error => {
+                    updateElement('mqtt-status', 'Error: ' + error.message);
+                })
+                .finally(() => {
+                    setButtonLoading('mqtt-publish-btn', false);
+                });
+        }
+        </script>
+        '''
+
+
 class MQTTModule(PicowicdModule):
     """
     MQTT Client Module for Wireless Sensor Networks.
@@ -141,11 +260,32 @@ class MQTTModule(PicowicdModule):
         self.mqtt_client = None
         self.connected = False
         self.last_publish = 0
+        self._next_publish_at = self.last_publish + self.publish_interval
         self.connection_attempts = 0
+        self._last_reconnect_attempt = time.monotonic()
+        self._last_loop = 0
+        self._loop_interval = 0.1  # seconds between mqtt_client.loop() polls
+        self._backoff = RECONNECT_BACKOFF_MIN
+        
+        # Optional callable invoked with no arguments after each successful publish
+        self.on_publish = None
+        
+        # Last values sent to the broker, for publish-on-change
+        self._last_values = {"temperature": None, "humidity": None, "battery_voltage": None}
+        self._intervals_since_status = 0
+        self._last_published_status = None
+        
+        # SHT45 module reference, resolved on first use
+        self._sht45 = None
+        
+        # State for the mock-data LCG (avoids importing random)
+        self._rng_state = 0x12345
         
         # Status tracking for dashboard
         self.status_message = "MQTT module initialized"
         self.last_error = None
+        self._error_html_for = None
+        self._error_html = ""
         
         # Initialize MQTT client
         self._setup_mqtt_client()
@@ -162,16 +302,18 @@ class MQTTModule(PicowicdModule):
         """
         try:
             # MQTT broker settings
-            self.broker_host = os.getenv("MQTT_BROKER", "192.168.99.1")
-            self.broker_port = int(os.getenv("MQTT_PORT", "1883"))
-            self.username = os.getenv("MQTT_USERNAME", None)
-            self.password = os.getenv("MQTT_PASSWORD", None)
-            self.node_id = os.getenv("MQTT_NODE_ID", "node01")
-            self.publish_interval = int(os.getenv("MQTT_PUBLISH_INTERVAL", "60"))
-            self.keepalive = int(os.getenv("MQTT_KEEPALIVE", "60"))
+            self.broker_host = _cached_getenv("MQTT_BROKER", "192.168.99.1")
+            self.broker_port = int(_cached_getenv("MQTT_PORT", "1883"))
+            self.username = _cached_getenv("MQTT_USERNAME", None)
+            self.password = _cached_getenv("MQTT_PASSWORD", None)
+            self.node_id = _cached_getenv("MQTT_NODE_ID", "node01")
+            self.publish_interval = int(_cached_getenv("MQTT_PUBLISH_INTERVAL", "60"))
+            self.keepalive = int(_cached_getenv("MQTT_KEEPALIVE", "60"))
+            self.batch_publish = str(_cached_getenv("MQTT_BATCH_PUBLISH", "0")).lower() in _TRUTHY
+            self._debug = _cached_getenv("MQTT_DEBUG", "0") == "1"
             
             # Topic configuration
-            topic_base = os.getenv("MQTT_TOPIC_BASE", "wcs")
+            topic_base = _cached_getenv("MQTT_TOPIC_BASE", "wcs")
             self.topic_temperature = f"{topic_base}/{self.node_id}/temperature"
             self.topic_humidity = f"{topic_base}/{self.node_id}/humidity"
             self.topic_battery = f"{topic_base}/{self.node_id}/battery"
@@ -189,10 +331,22 @@ class MQTTModule(PicowicdModule):
             self.node_id = "node01"
             self.publish_interval = 60
             self.keepalive = 60
+            self.batch_publish = False
+            self._debug = False
             self.topic_temperature = f"wcs/{self.node_id}/temperature"
             self.topic_humidity = f"wcs/{self.node_id}/humidity"
             self.topic_battery = f"wcs/{self.node_id}/battery"
             self.topic_status = f"wcs/{self.node_id}/status"
+        
+        # Publish-time constants derived from the config above
+        self._topics = (self.topic_temperature, self.topic_humidity,
+                        self.topic_battery, self.topic_status)
+        # Single-pass % templates, so each payload is one allocation rather
+        # than a chain of intermediate concatenation results
+        self._status_template = ('{"status":"online","timestamp":%s,"data":{"temperature":%s,'
+                                 '"humidity":%s,"battery_voltage":%s,"timestamp":%s,'
+                                 '"node_id":' + json.dumps(self.node_id).replace('%', '%%') + '}}')
+        self._batch_template = '{"t":%s,"h":%s,"b":%s,"ts":%s}'
     
     def _setup_mqtt_client(self):
         """
@@ -200,10 +354,19 @@ class MQTTModule(PicowicdModule):
         
         Creates MQTT client instance with proper socket pool, keepalive
         settings, authentication, and callback function assignments.
+        
+        The node ID is used as the MQTT client ID and ``connect_mqtt``
+        requests a persistent session (``clean_session=False``), so the
+        broker retains session state between reconnects. Status messages
+        are published retained at QoS 1, so late subscribers see the last
+        state immediately; sensor topics are sent unretained at QoS 0.
         """
         try:
-            # Create socket pool
-            pool = socketpool.SocketPool(wifi.radio)
+            # Reuse the foundation's socket pool, creating and sharing one if needed
+            pool = getattr(self.foundation, "socket_pool", None)
+            if pool is None:
+                pool = socketpool.SocketPool(wifi.radio)
+                self.foundation.socket_pool = pool
             
             # Create MQTT client with authentication
             self.mqtt_client = MQTT.MQTT(
@@ -212,6 +375,7 @@ class MQTTModule(PicowicdModule):
                 username=self.username,
                 password=self.password,
                 socket_pool=pool,
+                client_id=self.node_id,  # Stable ID so the broker can resume our session
                 keep_alive=self.keepalive,
                 is_ssl=False  # No SSL for local broker
             )
@@ -242,16 +406,32 @@ class MQTTModule(PicowicdModule):
         """
         self.connected = True
         self.connection_attempts += 1
+        self._backoff = RECONNECT_BACKOFF_MIN
         self.status_message = f"Connected to {self.broker_host}"
         self.last_error = None
         self.foundation.startup_print(f"MQTT connected: {self.status_message}")
         
         # Publish online status
         try:
-            self.mqtt_client.publish(self.topic_status, "online")
+            self._publish_presence("online")
         except Exception as e:
             self.foundation.startup_print(f"Status publish failed: {e}")
     
+    def _publish_presence(self, state):
+        """
+        Publish an "online"/"offline" presence string to the status topic.
+        
+        Skips the publish when the same state was the last one sent, so a
+        flapping link reconnecting repeatedly does not spam the broker.
+        
+        :param state: Presence value to publish
+        :type state: str
+        """
+        if state == self._last_published_status:
+            return
+        self.mqtt_client.publish(self.topic_status, state, retain=True, qos=1)
+        self._last_published_status = state
+    
     def _on_disconnect(self, client, userdata, rc):
         """
         Callback for MQTT disconnection.
@@ -279,7 +459,8 @@ class MQTTModule(PicowicdModule):
         :param message: Message payload
         :type message: str
         """
-        self.foundation.startup_print(f"MQTT message: {topic} = {message}")
+        if self._debug:
+            self.foundation.startup_print(f"MQTT message: {topic} = {message}")
     
     def connect_mqtt(self):
         """
@@ -310,7 +491,10 @@ class MQTTModule(PicowicdModule):
             self.status_message = "Connecting..."
             self.foundation.startup_print(f"Connecting to MQTT broker {self.broker_host}:{self.broker_port}")
             
-            self.mqtt_client.connect()
+            # Persistent session: the broker keeps subscriptions and queued
+            # QoS 1 messages across reconnects, at the cost of holding
+            # per-node state on the broker while the node is offline
+            self.mqtt_client.connect(clean_session=False)
             return True, "Connection initiated"
             
         except Exception as e:
@@ -334,7 +518,7 @@ class MQTTModule(PicowicdModule):
         
         try:
             # Publish offline status before disconnecting
-            self.mqtt_client.publish(self.topic_status, "offline")
+            self._publish_presence("offline")
             self.mqtt_client.disconnect()
             return True, "Disconnected"
             
@@ -343,6 +527,19 @@ class MQTTModule(PicowicdModule):
             self.foundation.startup_print(self.last_error)
             return False, str(e)
     
+    def _rand01(self):
+        """
+        Return a pseudo-random float in [0, 1] for mock sensor jitter.
+        
+        Small linear congruential generator, good enough for simulated
+        readings without the RAM cost of importing ``random``.
+        
+        :return: Pseudo-random value
+        :rtype: float
+        """
+        self._rng_state = (self._rng_state * 1103515245 + 12345) & 0x7fffffff
+        return self._rng_state / 0x7fffffff
+    
     def get_sensor_data(self):
         """
         Get sensor readings from real SHT45 hardware or fallback to mock data.
@@ -367,14 +564,14 @@ class MQTTModule(PicowicdModule):
             data = mqtt.get_sensor_data()
             print(f"Temperature: {data['temperature']}°C")
         """
-        import time
-        import random
-        
         current_time = time.monotonic()
         
         # Try to get real sensor data from SHT45 module
         try:
-            sht45_module = self.foundation.get_module("sht45")
+            # Look the module up once it is registered, then reuse the reference
+            if self._sht45 is None:
+                self._sht45 = self.foundation.get_module("sht45")
+            sht45_module = self._sht45
             if sht45_module and sht45_module.sensor_available:
                 reading = sht45_module.get_sensor_reading()
                 
@@ -383,7 +580,7 @@ class MQTTModule(PicowicdModule):
                     sensor_data = {
                         "temperature": reading['temperature'],
                         "humidity": reading['humidity'],
-                        "battery_voltage": round(3.7 + 0.3 * random.random(), 2),  # Still simulated
+                        "battery_voltage": 3.7 + 0.3 * self._rand01(),  # Still simulated
                         "timestamp": int(current_time),
                         "node_id": self.node_id
                     }
@@ -397,27 +594,35 @@ class MQTTModule(PicowicdModule):
         base_humidity = 65.0  # Base humidity percentage
         
         # Add some realistic variation
-        temp_variation = 2.0 * (0.5 - random.random())  # ±1°C variation
-        humidity_variation = 5.0 * (0.5 - random.random())  # ±2.5% variation
+        temp_variation = 2.0 * (0.5 - self._rand01())  # ±1°C variation
+        humidity_variation = 5.0 * (0.5 - self._rand01())  # ±2.5% variation
         
         sensor_data = {
-            "temperature": round(base_temp + temp_variation, 2),
-            "humidity": round(base_humidity + humidity_variation, 1),
-            "battery_voltage": round(3.7 + 0.3 * random.random(), 2),  # 3.7-4.0V
+            "temperature": base_temp + temp_variation,
+            "humidity": base_humidity + humidity_variation,
+            "battery_voltage": 3.7 + 0.3 * self._rand01(),  # 3.7-4.0V
             "timestamp": int(current_time),
             "node_id": self.node_id
         }
         
         return sensor_data
     
-    def publish_sensor_data(self):
+    def publish_sensor_data(self, force=False):
         """
         Publish current sensor readings to MQTT broker.
         
-        Gathers sensor data and publishes to configured topics.
-        Currently uses mock data that can be easily replaced with
-        real sensor readings.
+        Gathers sensor data and publishes to configured topics. Each sensor
+        topic is only published when its value has moved by at least the
+        matching ``PUBLISH_THRESHOLDS`` entry since the last publish. The
+        JSON status is sent whenever any value changed, and at least every
+        ``STATUS_HEARTBEAT_INTERVALS`` calls as a heartbeat.
+        
+        With ``MQTT_BATCH_PUBLISH`` enabled, the per-topic publishes are
+        replaced by a single compact JSON message on the status topic:
+        ``{"t": temperature, "h": humidity, "b": battery, "ts": timestamp}``.
         
+        :param force: Publish all topics regardless of change
+        :type force: bool
         :return: True if publish successful, False otherwise
         :rtype: bool
         :raises PublishError: If MQTT publish fails
@@ -433,7 +638,7 @@ class MQTTModule(PicowicdModule):
         
             # Manual publish trigger
             if mqtt.connected:
-                success = mqtt.publish_sensor_data()
+                success = mqtt.publish_sensor_data(force=True)
                 print(f"Publish: {'OK' if success else 'Failed'}")
         """
         if not self.connected or not self.mqtt_client:
@@ -444,25 +649,61 @@ class MQTTModule(PicowicdModule):
             # Get sensor readings
             sensor_data = self.get_sensor_data()
             
-            # Publish individual sensor values
-            self.mqtt_client.publish(self.topic_temperature, str(sensor_data["temperature"]))
-            self.mqtt_client.publish(self.topic_humidity, str(sensor_data["humidity"]))
-            self.mqtt_client.publish(self.topic_battery, str(sensor_data["battery_voltage"]))
+            topic_temperature, topic_humidity, topic_battery, topic_status = self._topics
             
-            # Publish complete JSON data to status topic
-            import json
-            status_data = {
-                "status": "online",
-                "timestamp": sensor_data["timestamp"],
-                "data": sensor_data
-            }
-            self.mqtt_client.publish(self.topic_status, json.dumps(status_data))
+            # Unpack once and format each value once to its published precision;
+            # the strings are shared by the per-topic publishes and the JSON status
+            t, h, b = sensor_data["temperature"], sensor_data["humidity"], sensor_data["battery_voltage"]
+            temperature, humidity, battery = "%.1f" % t, "%.1f" % h, "%.2f" % b
+            timestamp = str(sensor_data["timestamp"])
+            
+            # Work out which sensor values moved past their threshold
+            changed = []
+            for reading in (("temperature", t, temperature, topic_temperature),
+                            ("humidity", h, humidity, topic_humidity),
+                            ("battery_voltage", b, battery, topic_battery)):
+                key = reading[0]
+                last = self._last_values[key]
+                if force or last is None or abs(reading[1] - last) >= PUBLISH_THRESHOLDS[key]:
+                    changed.append(reading)
+            
+            self._intervals_since_status += 1
+            send_status = changed or self._intervals_since_status >= STATUS_HEARTBEAT_INTERVALS
+            
+            if self.batch_publish:
+                # One compact JSON message on the status topic carries everything
+                if send_status:
+                    payload = self._batch_template % (temperature, humidity, battery, timestamp)
+                    self.mqtt_client.publish(topic_status, payload, retain=True, qos=1)
+                    self._intervals_since_status = 0
+            else:
+                # Publish individual sensor values that changed
+                for key, value, text, topic in changed:
+                    self.mqtt_client.publish(topic, text, retain=False, qos=0)
+                
+                # Publish complete JSON data to status topic, filled into the
+                # precomputed template instead of building a dict for json.dumps
+                if send_status:
+                    payload = self._status_template % (timestamp, temperature, humidity,
+                                                       battery, timestamp)
+                    self.mqtt_client.publish(topic_status, payload, retain=True, qos=1)
+                    self._intervals_since_status = 0
+            
+            for key, value, text, topic in changed:
+                self._last_values[key] = value
             
             # Update status
-            self.status_message = f"Published: T={sensor_data['temperature']}°C, H={sensor_data['humidity']}%"
+            if changed:
+                self.status_message = f"Published: T={temperature}°C, H={humidity}%"
+            else:
+                self.status_message = f"Unchanged: T={temperature}°C, H={humidity}%"
             self.last_publish = time.monotonic()
+            self._next_publish_at = self.last_publish + self.publish_interval
             
-            self.foundation.startup_print(f"MQTT published: {self.status_message}")
+            if self._debug:
+                self.foundation.startup_print(f"MQTT published: {self.status_message}")
+            if self.on_publish:
+                self.on_publish()
             return True
             
         except Exception as e:
@@ -472,53 +713,59 @@ class MQTTModule(PicowicdModule):
         
     def register_routes(self, server):
         """
-        Register MQTT control web endpoints.
+        Register MQTT control web endpoint.
         
-        Adds HTTP routes for manual MQTT control via web interface.
-        Provides endpoints for connection, disconnection, and test publishing.
+        Adds a single HTTP route for manual MQTT control via web interface.
+        The ``action`` query parameter selects connection, disconnection,
+        or test publishing, dispatched through a dict lookup.
         
         :param server: HTTP server instance to register routes with
         :type server: adafruit_httpserver.Server
-        """
         
-        @server.route("/mqtt-connect", methods=['POST'])
-        def mqtt_connect(request: Request):
-            """Manual MQTT connection trigger"""
-            try:
-                success, message = self.connect_mqtt()
-                return Response(request, message, content_type="text/plain")
-            except Exception as e:
-                self.last_error = str(e)
-                return Response(request, f"Error: {str(e)}", content_type="text/plain")
+        **Available Routes:**
         
-        @server.route("/mqtt-disconnect", methods=['POST'])
-        def mqtt_disconnect(request: Request):
-            """Manual MQTT disconnection"""
-            try:
-                success, message = self.disconnect_mqtt()
-                return Response(request, message, content_type="text/plain")
-            except Exception as e:
-                self.last_error = str(e)
-                return Response(request, f"Error: {str(e)}", content_type="text/plain")
+        * ``POST /mqtt?action=connect`` - Manual MQTT connection trigger
+        * ``POST /mqtt?action=disconnect`` - Manual MQTT disconnection
+        * ``POST /mqtt?action=publish`` - Manual publish trigger for testing
+        """
+        actions = {
+            "connect": self._action_connect,
+            "disconnect": self._action_disconnect,
+            "publish": self._action_publish
+        }
         
-        @server.route("/mqtt-publish", methods=['POST'])
-        def mqtt_publish_manual(request: Request):
-            """Manual publish trigger for testing"""
+        @server.route("/mqtt", methods=['POST'])
+        def mqtt_action(request: Request):
+            """Dispatch manual MQTT control actions"""
             try:
-                if not self.connected:
-                    return Response(request, "Not connected", content_type="text/plain")
-                
-                # Publish test sensor data
-                success = self.publish_sensor_data()
-                if success:
-                    return Response(request, "Test data published", content_type="text/plain")
-                else:
-                    return Response(request, f"Publish failed: {self.last_error}", content_type="text/plain")
-                    
+                handler = actions.get(request.query_params.get("action"))
+                if handler is None:
+                    return Response(request, "Unknown MQTT action", content_type="text/plain")
+                return Response(request, handler(), content_type="text/plain")
             except Exception as e:
                 self.last_error = str(e)
                 return Response(request, f"Error: {str(e)}", content_type="text/plain")
     
+    def _action_connect(self):
+        """Manual MQTT connection trigger"""
+        success, message = self.connect_mqtt()
+        return message
+    
+    def _action_disconnect(self):
+        """Manual MQTT disconnection"""
+        success, message = self.disconnect_mqtt()
+        return message
+    
+    def _action_publish(self):
+        """Manual publish trigger for testing"""
+        if not self.connected:
+            return "Not connected"
+        
+        # Publish test sensor data
+        if self.publish_sensor_data(force=True):
+            return "Test data published"
+        return f"Publish failed: {self.last_error}"
+    
     def get_dashboard_html(self):
         """
         Return HTML for MQTT control interface.
@@ -532,114 +779,45 @@ class MQTTModule(PicowicdModule):
         connection_status = "Connected" if self.connected else "Disconnected"
         connection_color = "#28a745" if self.connected else "#dc3545"
         
-        return f'''
-        <div class="module">
-            <h3>MQTT Client - {self.node_id}</h3>
-            
-            <div class="status" style="border-left: 4px solid {connection_color};">
-                <strong>Status:</strong> {connection_status}<br>
-                <strong>Message:</strong> {self.status_message}<br>
-                <strong>Attempts:</strong> {self.connection_attempts}<br>
-                <strong>Last Published:</strong> {self._format_last_publish()}
-            </div>
-            
-            <div class="control-group">
-                <button id="mqtt-connect-btn" onclick="mqttConnect()">Connect</button>
-                <button id="mqtt-disconnect-btn" onclick="mqttDisconnect()">Disconnect</button>
-                <button id="mqtt-publish-btn" onclick="mqttPublish()">Test Publish</button>
-            </div>
-            
-            <div id="mqtt-status" class="status">
-                Ready for MQTT operations
-            </div>
-            
-            {self._get_error_display()}
-        </div>
-
-        <script>
-        function mqttConnect() {{
-            setButtonLoading('mqtt-connect-btn', true);
-            serverRequest('/mqtt-connect')
-                .then(result => {{
-                    updateElement('mqtt-status', 'Status: ' + result);
-                    setTimeout(() => location.reload(), 1000); // Refresh to show new status
-                }})
-                .catch(error => {{
-                    updateElement('mqtt-status', 'Error: ' + error.message);
-                }})
-                .finally(() => {{
-                    setButtonLoading('mqtt-connect-btn', false);
-                }});
-        }}
-
-        function mqttDisconnect() {{
-            setButtonLoading('mqtt-disconnect-btn', true);
-            serverRequest('/mqtt-disconnect')
-                .then(result => {{
-                    updateElement('mqtt-status', 'Status: ' + result);
-                    setTimeout(() => location.reload(), 1000); // Refresh to show new status
-                }})
-                .catch(error => {{
-                    updateElement('mqtt-status', 'Error: ' + error.message);
-                }})
-                .finally(() => {{
-                    setButtonLoading('mqtt-disconnect-btn', false);
-                }});
-        }}
-
-        function mqttPublish() {{
-            setButtonLoading('mqtt-publish-btn', true);
-            serverRequest('/mqtt-publish')
-                .then(result => {{
-                    updateElement('mqtt-status', 'Status: ' + result);
-                }})
-                .catch(error => {{
-                    updateElement('mqtt-status', 'Error: ' + error.message);
-                }})
-                .finally(() => {{
-                    setButtonLoading('mqtt-publish-btn', false);
-                }});
-        }}
-        </script>
-        '''
+        # Time since last publish, in the largest whole unit
+        if self.last_publish == 0:
+            last_published = "Never"
+        else:
+            seconds_ago = int(time.monotonic() - self.last_publish)
+            if seconds_ago < 60:
+                last_published = "%ds ago" % seconds_ago
+            elif seconds_ago < 3600:
+                last_published = "%dm ago" % (seconds_ago // 60)
+            else:
+                last_published = "%dh ago" % (seconds_ago // 3600)
+        
+        return (_DASHBOARD_HEAD % (self.node_id, connection_color, connection_status,
+                                   self.status_message, self.connection_attempts,
+                                   last_published)
+                + self._get_error_display() + _DASHBOARD_JS)
     
     def _get_error_display(self):
         """
         Helper to show last error if any.
         
+        The markup is rebuilt only when ``last_error`` changes.
+        
         :return: HTML error display or empty string
         :rtype: str
         """
-        if self.last_error:
-            return f'''
+        if self.last_error != self._error_html_for:
+            self._error_html_for = self.last_error
+            if self.last_error:
+                self._error_html = f'''
             <div class="status" style="border-left: 4px solid #dc3545;">
                 <strong>Last Error:</strong> {self.last_error}
             </div>
             '''
-        return ""
-    
-    def _format_last_publish(self):
-        """
-        Helper to format last publish time.
-        
-        :return: Human-readable time since last publish
-        :rtype: str
-        """
-        if self.last_publish == 0:
-            return "Never"
-        
-        import time
-        current_time = time.monotonic()
-        seconds_ago = int(current_time - self.last_publish)
-        
-        if seconds_ago < 60:
-            return f"{seconds_ago}s ago"
-        elif seconds_ago < 3600:
-            return f"{seconds_ago // 60}m ago"
-        else:
-            return f"{seconds_ago // 3600}h ago"
+            else:
+                self._error_html = ""
+        return self._error_html
     
-    def update(self):
+    def update(self, now=None):
         """
         Called from main loop - handle MQTT operations.
         
@@ -647,10 +825,11 @@ class MQTTModule(PicowicdModule):
         automatic reconnection, and scheduled sensor data publishing.
         Called continuously by the foundation main loop.
         """
-        current_time = time.monotonic()
+        current_time = time.monotonic() if now is None else now
         
-        # Handle MQTT client loop (process callbacks)
-        if self.mqtt_client:
+        # Handle MQTT client loop (process callbacks), at most every _loop_interval
+        if self.mqtt_client and current_time - self._last_loop >= self._loop_interval:
+            self._last_loop = current_time
             try:
                 self.mqtt_client.loop()  # Process MQTT callbacks
             except Exception as e:
@@ -661,16 +840,14 @@ class MQTTModule(PicowicdModule):
         
         # Auto-reconnect logic
         if not self.connected and self.mqtt_client:
-            # Try to reconnect every 30 seconds
-            if hasattr(self, '_last_reconnect_attempt'):
-                if current_time - self._last_reconnect_attempt > 30:
-                    self._attempt_reconnect()
-            else:
-                self._last_reconnect_attempt = current_time
+            # Try to reconnect, backing off exponentially after failures
+            if current_time - self._last_reconnect_attempt > self._backoff:
+                self._attempt_reconnect()
         
         # Automatic publishing when connected
-        if self.connected and (current_time - self.last_publish >= self.publish_interval):
-            self.foundation.startup_print("Auto-publishing sensor data...")
+        if self.connected and current_time >= self._next_publish_at:
+            if self._debug:
+                self.foundation.startup_print("Auto-publishing sensor data...")
             self.publish_sensor_data()
     
     def _attempt_reconnect(self):
@@ -678,13 +855,15 @@ class MQTTModule(PicowicdModule):
         Attempt automatic reconnection.
         
         Internal method for handling automatic MQTT reconnection
-        when connection is lost.
+        when connection is lost. Each failure doubles the wait before
+        the next attempt, up to ``RECONNECT_BACKOFF_MAX`` seconds.
         """
         self._last_reconnect_attempt = time.monotonic()
         self.foundation.startup_print("Attempting MQTT reconnection...")
         success, message = self.connect_mqtt()
         if not success:
             self.status_message = f"Reconnect failed: {message}"
+            self._backoff = min(self._backoff * 2, RECONNECT_BACKOFF_MAX)
     
     def cleanup(self):
         """
@@ -696,8 +875,9 @@ class MQTTModule(PicowicdModule):
         if self.connected and self.mqtt_client:
             try:
                 self.foundation.startup_print("MQTT cleanup: Publishing offline status")
-                self.mqtt_client.publish(self.topic_status, "offline")
+                self._publish_presence("offline")
                 self.mqtt_client.disconnect()
                 self.connected = False
             except Exception as e:
-                self.foundation.startup_print(f"MQTT cleanup error: {e}")
\ No newline at end of file
+                self.foundation.startup_print(f"MQTT cleanup error: {e}")
+        self._sht45 = None
\ No newline at end of file
@@ -6,6 +6,10 @@ Copy this as your code.py to test the MQTT module
 import gc
 import time
 
+gc.collect()  # start the test from a compacted heap
+
+MOCK_LOG_LINES = 32  # oldest mock log messages are dropped past this
+
 # Mock foundation class for testing (matches your pattern)
 class MockFoundation:
     def __init__(self):
@@ -19,9 +23,16 @@ class MockFoundation:
         
         self.config = MockConfig()
         
-    def startup_print(self, message):
+    def startup_print(self, message, *args):
+        if args:
+            message = message % args
         print(f"[Foundation] {message}")
-        self.startup_log.append(message)
+        # Bounded like the real foundation's log; a plain list because
+        # CircuitPython's deque cannot be iterated for the summary below
+        log = self.startup_log
+        log.append(message)
+        if len(log) > MOCK_LOG_LINES:
+            del log[0]
 
 # Mock server for route testing
 class MockServer:
@@ -34,6 +45,13 @@ class MockServer:
             return func
         return decorator
 
+def idle_forever():
+    """Collect once, report free memory, then idle without further collections."""
+    gc.collect()
+    print(f"Memory free: {gc.mem_free()} bytes")
+    while True:
+        time.sleep(1)
+
 def main():
     try:
         print("=== MQTT Module Step 1 Test ===")
@@ -103,8 +121,7 @@ def main():
         
         # Keep running like a normal CircuitPython program
         print("\nTest completed. Ctrl+C to stop or reset board.")
-        while True:
-            time.sleep(1)
+        idle_forever()
         
     except Exception as e:
         print(f"\n=== Step 1 Test FAILED ===")
@@ -114,16 +131,8 @@ def main():
         
         # Keep running so you can see the error
         print("\nError occurred. Ctrl+C to stop or reset board.")
-        while True:
-            time.sleep(1)
-        
-    finally:
-        gc.collect()
-        print(f"Memory free: {gc.mem_free()} bytes")
+        idle_forever()
 
 # Run the test when loaded as code.py
 if __name__ == "__main__":
-    main()
-else:
-    # Also run if imported (CircuitPython behavior)
     main()
\ No newline at end of file
@@ -37,8 +37,6 @@ Implementation Notes
 """
 
 import time
-import board
-import busio
 from module_base import PicowicdModule
 from adafruit_httpserver import Request, Response
 from adafruit_pcf8523.pcf8523 import PCF8523
@@ -46,6 +44,45 @@ from adafruit_pcf8523.pcf8523 import PCF8523
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/picowicd/picowicd.git"
 
+_MSG_RTC_UNAVAILABLE = b"RTC not available"  # /rtc-status reply without RTC hardware
+
+_STATUS_CACHE_TIME = 0.5  # seconds one batched RTC read stays current
+_YES_NO = ("No", "Yes")  # indexed by a status flag
+_DEC2 = tuple("%02d" % i for i in range(61))  # zero-padded hh/mm/ss, 60 for a leap second
+
+# Dashboard widget with the status button; static, so returned as is
+_RTC_DASHBOARD_HTML = '''
+        <div class="module">
+            <h3>RTC Control</h3>
+            <div class="control-group">
+                <button id="rtc-status-btn" onclick="getRTCStatus()">Get RTC Status</button>
+            </div>
+            <p id="rtc-display-status">RTC Status: Click button</p>
+        </div>
+
+        <script>
+        // JavaScript for Get RTC Status
+        function getRTCStatus() {
+            const btn = document.getElementById('rtc-status-btn');
+            btn.disabled = true;
+            btn.textContent = 'Reading...';
+
+            fetch('/rtc-status', { method: 'POST' })
+                .then(response => response.text())
+                .then(result => {
+                    btn.disabled = false;
+                    btn.textContent = 'Get RTC Status';
+                    document.getElementById('rtc-display-status').innerHTML = 'RTC Status: ' + result;
+                })
+                .catch(error => {
+                    btn.disabled = false;
+                    btn.textContent = 'Get RTC Status';
+                    document.getElementById('rtc-display-status').textContent = 'Error: ' + error.message;
+                });
+        }
+        </script>
+        '''
+
 
 class RTCControlModule(PicowicdModule):
     """
@@ -82,6 +119,11 @@ class RTCControlModule(PicowicdModule):
             current_time = rtc_module.rtc.datetime
             print(f"Current time: {current_time}")
     """
+
+    DAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+    # Time written back after a low battery or power loss (Saturday 2000/01/01)
+    _RESET_TIME = time.struct_time((2000, 1, 1, 0, 0, 0, 5, -1, -1))
     
     def __init__(self, foundation):
         """
@@ -97,17 +139,23 @@ class RTCControlModule(PicowicdModule):
         self.name = "RTC Control"
 
         try:
-            self.i2c = busio.I2C(board.GP5, board.GP4)
+            self.i2c = self.foundation.get_i2c()
             self.rtc = PCF8523(self.i2c)
             self.rtc_available = True
             self.foundation.startup_print("RTC PCF8523 initialized successfully.")
         except Exception as e:
             self.rtc_available = False
-            self.foundation.startup_print(f"RTC initialization failed: {str(e)}. RTC will be unavailable.")
+            self.foundation.startup_print("RTC initialization failed: %s. RTC will be unavailable.", e)
+
+        # One batched (datetime, battery_low, lost_power) read shared by
+        # rtc_status and the properties for _STATUS_CACHE_TIME seconds
+        self._cache_t = -1e9
+        self._cache = (None, None, None)
 
-        self.days = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
-        self.last_update_time = time.monotonic()
-        self.update_interval = 10  # seconds
+        # Last /rtc-status reading and its rendered reply, reused until the
+        # second or battery flags change
+        self._fmt_cache_key = None
+        self._fmt_cache_val = None
 
     def register_routes(self, server):
         """
@@ -122,53 +170,67 @@ class RTCControlModule(PicowicdModule):
         
         * ``POST /rtc-status`` - Get current RTC status including time, battery, and power loss status
         """
-        @server.route("/rtc-status", methods=['POST'])
-        def rtc_status(request: Request):
-            """
-            Handle RTC status requests.
-            
-            Returns current time, battery status, and power loss detection.
-            If battery is low or power was lost, automatically resets time to 2000/01/01.
-            
-            :param request: HTTP request object
-            :type request: Request
-            :return: HTTP response with RTC status
-            :rtype: Response
-            """
-            try:
-                if not self.rtc_available:
-                    return Response(request, "RTC not available", content_type="text/plain")
+        # rtc_available is only decided at init, so pick the handler once
+        handler = self._rtc_status_handler if self.rtc_available else self._rtc_unavailable_handler
+        server.route("/rtc-status", methods=['POST'])(handler)
+
+    def _rtc_unavailable_handler(self, request: Request):
+        """Answer /rtc-status when no RTC hardware was found at init."""
+        return Response(request, _MSG_RTC_UNAVAILABLE, content_type="text/plain")
 
-                current_time = self.rtc.datetime
+    def _rtc_status_handler(self, request: Request):
+        """
+        Handle RTC status requests.
+        
+        Returns current time, battery status, and power loss detection.
+        If battery is low or power was lost, automatically resets time to 2000/01/01.
+        
+        :param request: HTTP request object
+        :type request: Request
+        :return: HTTP response with RTC status
+        :rtype: Response
+        """
+        try:
+            current_time, battery_low, lost_power = self._read_status()
+
+            if battery_low or lost_power:
+                self.foundation.startup_print("RTC: Battery low or power lost detected. Setting time to 2000/01/01 00:00:00.")
+                self.rtc.datetime = self._RESET_TIME
+                # Writing the time clears the oscillator-stop (lost power)
+                # flag; only the battery flag reflects hardware state
+                current_time, lost_power = self._RESET_TIME, False
                 battery_low = self.rtc.battery_low
-                lost_power = self.rtc.lost_power
+                self._cache = (current_time, battery_low, lost_power)
+                self._cache_t = time.monotonic()
 
-                if battery_low or lost_power:
-                    self.foundation.startup_print("RTC: Battery low or power lost detected. Setting time to 2000/01/01 00:00:00.")
-                    t = time.struct_time((2000, 1, 1, 0, 0, 0, 5, -1, -1))
-                    self.rtc.datetime = t
-                    current_time = self.rtc.datetime
-                    battery_low = self.rtc.battery_low
-                    lost_power = self.rtc.lost_power
+                status_prefix = "RTC Reset: "
+            else:
+                status_prefix = "RTC Status: "
 
-                    status_prefix = "RTC Reset: "
-                else:
-                    status_prefix = "RTC Status: "
+            # One unpack instead of an attribute lookup per field
+            year, mon, mday, hour, minute, sec, wday = current_time[:7]
+            key = (year, mon, mday, hour, minute, sec, battery_low, lost_power)
+            if key == self._fmt_cache_key:
+                formatted_time, status_text = self._fmt_cache_val
+            else:
+                formatted_time = f"{self.DAYS[wday]} {mon}/{mday}/{year} {_DEC2[hour]}:{_DEC2[minute]}:{_DEC2[sec]}"
 
-                formatted_time = f"{self.days[current_time.tm_wday]} {current_time.tm_mon}/{current_time.tm_mday}/{current_time.tm_year} {current_time.tm_hour:02d}:{current_time.tm_min:02d}:{current_time.tm_sec:02d}"
+                status_text = (f"Time: {formatted_time}<br>"
+                               f"Battery Low: {_YES_NO[bool(battery_low)]}<br>"
+                               f"Lost Power: {_YES_NO[bool(lost_power)]}").encode("utf-8")
 
-                status_text = f"Time: {formatted_time}<br>"
-                status_text += f"Battery Low: {'Yes' if battery_low else 'No'}<br>"
-                status_text += f"Lost Power: {'Yes' if lost_power else 'No'}"
+                self._fmt_cache_key = key
+                self._fmt_cache_val = (formatted_time, status_text)
 
-                self.foundation.startup_print(f"{status_prefix}{formatted_time}, Bat Low: {battery_low}, Lost Pwr: {lost_power}")
+            self.foundation.startup_print("%s%s, Bat Low: %s, Lost Pwr: %s", status_prefix, formatted_time,
+                                          battery_low, lost_power)
 
-                return Response(request, status_text, content_type="text/html")
+            return Response(request, status_text, content_type="text/html")
 
-            except Exception as e:
-                error_msg = f"Error reading/setting RTC: {str(e)}"
-                self.foundation.startup_print(error_msg)
-                return Response(request, error_msg, content_type="text/plain")
+        except Exception as e:
+            error_msg = f"Error reading/setting RTC: {e}"
+            self.foundation.startup_print(error_msg)
+            return Response(request, error_msg, content_type="text/plain")
 
     def get_dashboard_html(self):
         """
@@ -180,53 +242,7 @@ class RTCControlModule(PicowicdModule):
         :return: HTML string containing dashboard widget
         :rtype: str
         """
-        return '''
-        <div class="module">
-            <h3>RTC Control</h3>
-            <div class="control-group">
-                <button id="rtc-status-btn" onclick="getRTCStatus()">Get RTC Status</button>
-            </div>
-            <p id="rtc-display-status">RTC Status: Click button</p>
-        </div>
-
-        <script>
-        // JavaScript for Get RTC Status
-        function getRTCStatus() {
-            const btn = document.getElementById('rtc-status-btn');
-            btn.disabled = true;
-            btn.textContent = 'Reading...';
-
-            fetch('/rtc-status', { method: 'POST' })
-                .then(response => response.text())
-                .then(result => {
-                    btn.disabled = false;
-                    btn.textContent = 'Get RTC Status';
-                    document.getElementById('rtc-display-status').innerHTML = 'RTC Status: ' + result;
-                })
-                .catch(error => {
-                    btn.disabled = false;
-                    btn.textContent = 'Get RTC Status';
-                    document.getElementById('rtc-display-status').textContent = 'Error: ' + error.message;
-                });
-        }
-        </script>
-        '''
-
-    def update(self):
-        """
-        Periodic update method called by foundation system.
-        
-        Performs regular maintenance tasks. Currently disabled to prevent
-        console spam but maintains compatibility with foundation system.
-        
-        .. note::
-           This method is called periodically by the PicoWicd foundation.
-           Override this method to add custom periodic tasks.
-        """
-        # FIX: Commented out the body of the update method to stop printing "Live RTC" updates.
-        # The method itself remains to avoid AttributeError if foundation_core.py calls it.
-        # This will prevent the "Live RTC..." messages from being printed.
-        pass
+        return _RTC_DASHBOARD_HTML
 
     def cleanup(self):
         """
@@ -237,6 +253,25 @@ class RTCControlModule(PicowicdModule):
         """
         pass
 
+    def _read_status(self, refresh=False):
+        """
+        Read datetime, battery_low and lost_power from the RTC in one batch.
+        
+        Reads within _STATUS_CACHE_TIME of the last batch reuse it instead of
+        going back to the I2C bus; refresh forces a new read. Exceptions from
+        the hardware propagate to the caller.
+        
+        :param bool refresh: Ignore the cached batch
+        :return: (datetime, battery_low, lost_power)
+        :rtype: tuple
+        """
+        now = time.monotonic()
+        if refresh or now - self._cache_t > _STATUS_CACHE_TIME:
+            rtc = self.rtc
+            self._cache = (rtc.datetime, rtc.battery_low, rtc.lost_power)
+            self._cache_t = now
+        return self._cache
+
     @property
     def current_time(self):
         """
@@ -254,7 +289,7 @@ class RTCControlModule(PicowicdModule):
         """
         if self.rtc_available:
             try:
-                return self.rtc.datetime
+                return self._read_status()[0]
             except Exception:
                 return None
         return None
@@ -269,7 +304,7 @@ class RTCControlModule(PicowicdModule):
         """
         if self.rtc_available:
             try:
-                return not self.rtc.battery_low
+                return not self._read_status()[1]
             except Exception:
                 return None
         return None
@@ -284,7 +319,7 @@ class RTCControlModule(PicowicdModule):
         """
         if self.rtc_available:
             try:
-                return self.rtc.lost_power
+                return self._read_status()[2]
             except Exception:
                 return None
         return None
\ No newline at end of file
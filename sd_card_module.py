@@ -39,12 +39,128 @@ Implementation Notes
 import storage
 import os
 import gc
+import time
+from micropython import const
 from module_base import PicowicdModule
 from adafruit_httpserver import Request, Response
 
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/picowicd/picowicd.git"
 
+_S_IFDIR = const(0x4000)  # directory bit in a stat/ilistdir mode
+COPY_CHUNK_SIZE = 16384  # bytes per read/write in copy_file; lets the card driver batch blocks
+CARD_INFO_TTL = 2.0  # seconds get_card_status() reuses the last statvfs() result
+READ_BUF_SIZE = 1024  # largest read_file() max_size served from the reused buffer
+
+# Lazy directory iterator yielding (name, type, inode[, size]) where the port
+# provides one (MicroPython); CircuitPython builds without it fall back to
+# os.listdir plus one os.stat per entry
+_ilistdir = getattr(os, "ilistdir", None)
+
+# Characters rejected anywhere in a path ('..' is checked separately)
+_DANGEROUS_CHARS = frozenset('<>|*?"')
+
+
+def _utf8_complete_len(data, n):
+    """
+    Length of data[:n] without a trailing, incomplete UTF-8 sequence.
+    
+    A read capped at max_size can stop inside a multi-byte character; the
+    partial bytes are dropped so the rest still decodes.
+    """
+    i = n - 1
+    # Walk back over at most three continuation bytes to the lead byte
+    while i >= 0 and n - i < 4 and (data[i] & 0xC0) == 0x80:
+        i -= 1
+    if i < 0:
+        return n
+    lead = data[i]
+    if lead >= 0xF0:
+        need = 4
+    elif lead >= 0xE0:
+        need = 3
+    elif lead >= 0xC0:
+        need = 2
+    else:
+        return n
+    return i if n - i < need else n
+
+# File type descriptions by lowercase extension
+_TYPE_MAP = {
+    '.txt': 'Text File',
+    '.log': 'Log File',
+    '.json': 'JSON Data',
+    '.csv': 'CSV Data',
+    '.py': 'Python Code',
+    '.md': 'Markdown',
+    '.html': 'HTML Document',
+    '.css': 'Stylesheet',
+    '.js': 'JavaScript'
+}
+
+# Dashboard widget with the status and file buttons; static, so returned as is
+_SD_DASHBOARD_HTML = '''
+        <div class="module">
+            <h3>SD Card Control</h3>
+            <div class="control-group">
+                <button id="sd-status-btn" onclick="getSDStatus()">Get SD Status</button>
+                <button id="sd-files-btn" onclick="getSDFiles()">List Files</button>
+                <a href="/sd-browse" target="_blank" class="btn" style="display: inline-block; padding: 8px 16px; background: #27ae60; color: white; text-decoration: none; border-radius: 4px;">File Browser</a>
+            </div>
+            <p id="sd-display-status">SD Status: Click button</p>
+            <div id="sd-file-list" style="margin-top: 10px; padding: 10px; background: #f9f9f9; border-radius: 5px; display: none;">
+                <strong>Files:</strong><br>
+                <div id="sd-files-content"></div>
+            </div>
+        </div>
+
+        <script>
+        // JavaScript for Get SD Status
+        function getSDStatus() {
+            const btn = document.getElementById('sd-status-btn');
+            btn.disabled = true;
+            btn.textContent = 'Reading...';
+
+            fetch('/sd-status', { method: 'POST' })
+                .then(response => response.text())
+                .then(result => {
+                    btn.disabled = false;
+                    btn.textContent = 'Get SD Status';
+                    document.getElementById('sd-display-status').innerHTML = 'SD Status: ' + result;
+                })
+                .catch(error => {
+                    btn.disabled = false;
+                    btn.textContent = 'Get SD Status';
+                    document.getElementById('sd-display-status').textContent = 'Error: ' + error.message;
+                });
+        }
+
+        // JavaScript for List Files
+        function getSDFiles() {
+            const btn = document.getElementById('sd-files-btn');
+            const fileList = document.getElementById('sd-file-list');
+            const filesContent = document.getElementById('sd-files-content');
+            
+            btn.disabled = true;
+            btn.textContent = 'Loading...';
+
+            fetch('/sd-files', { method: 'POST' })
+                .then(response => response.text())
+                .then(result => {
+                    btn.disabled = false;
+                    btn.textContent = 'List Files';
+                    filesContent.innerHTML = result;
+                    fileList.style.display = 'block';
+                })
+                .catch(error => {
+                    btn.disabled = false;
+                    btn.textContent = 'List Files';
+                    filesContent.textContent = 'Error: ' + error.message;
+                    fileList.style.display = 'block';
+                });
+        }
+        </script>
+        '''
 
 class SDCardModule(PicowicdModule):
     """
@@ -74,7 +190,10 @@ class SDCardModule(PicowicdModule):
         self.mount_point = "/sd"
         self.card_info = {}
         self.max_file_size = 1024 * 1024  # 1MB default limit
-        self.allowed_extensions = ['.txt', '.log', '.json', '.csv', '.py', '.md', '.html', '.css', '.js']
+        self.allowed_extensions = frozenset(('.txt', '.log', '.json', '.csv', '.py', '.md', '.html', '.css', '.js'))
+        self._copy_buf = None  # COPY_CHUNK_SIZE buffer, allocated on the first copy and reused
+        self._read_buf = None  # READ_BUF_SIZE buffer, allocated on the first small read_file
+        self._card_info_ts = -CARD_INFO_TTL  # monotonic time card_info was last refreshed
         
         try:
             self._detect_and_mount_card()
@@ -94,29 +213,8 @@ class SDCardModule(PicowicdModule):
         Sets card_available flag based on success.
         """
         try:
-            # Check if we can access the root filesystem (where SD would be mounted in CircuitPython)
-            # CircuitPython typically auto-mounts SD cards to the root filesystem
-            statvfs = os.statvfs("/")
-            
-            # Calculate storage information
-            block_size = statvfs[0]
-            total_blocks = statvfs[2]
-            free_blocks = statvfs[3]
-            
-            total_bytes = block_size * total_blocks
-            free_bytes = block_size * free_blocks
-            used_bytes = total_bytes - free_bytes
-            
-            self.card_info = {
-                'total_bytes': total_bytes,
-                'free_bytes': free_bytes,
-                'used_bytes': used_bytes,
-                'total_mb': round(total_bytes / (1024 * 1024), 2),
-                'free_mb': round(free_bytes / (1024 * 1024), 2),
-                'used_mb': round(used_bytes / (1024 * 1024), 2),
-                'usage_percent': round((used_bytes / total_bytes) * 100, 1) if total_bytes > 0 else 0
-            }
-            
+            self._probe_mount()
+            self._refresh_usage()
             self.card_available = True
             
         except Exception as e:
@@ -124,6 +222,44 @@ class SDCardModule(PicowicdModule):
             self.card_info = {}
             raise e
 
+    def _probe_mount(self):
+        """
+        Cheap check that the filesystem still answers; raises OSError if not.
+        
+        CircuitPython typically auto-mounts SD cards to the root filesystem.
+        """
+        os.stat("/")
+
+    def _refresh_usage(self):
+        """
+        Recompute card_info from os.statvfs().
+        
+        statvfs walks the FAT to count free clusters, so this is the slow
+        part of a status check. The MB and percentage figures are rounded
+        here once and stored alongside the raw byte counts.
+        """
+        statvfs = os.statvfs("/")
+        
+        # Calculate storage information
+        block_size = statvfs[0]
+        total_blocks = statvfs[2]
+        free_blocks = statvfs[3]
+        
+        total_bytes = block_size * total_blocks
+        free_bytes = block_size * free_blocks
+        used_bytes = total_bytes - free_bytes
+        
+        self._card_info_ts = time.monotonic()
+        self.card_info = {
+            'total_bytes': total_bytes,
+            'free_bytes': free_bytes,
+            'used_bytes': used_bytes,
+            'total_mb': round(total_bytes / (1024 * 1024), 2),
+            'free_mb': round(free_bytes / (1024 * 1024), 2),
+            'used_mb': round(used_bytes / (1024 * 1024), 2),
+            'usage_percent': round((used_bytes / total_bytes) * 100, 1) if total_bytes > 0 else 0
+        }
+
     def _validate_file_path(self, filepath):
         """
         Validate file path for safety and compatibility.
@@ -133,22 +269,23 @@ class SDCardModule(PicowicdModule):
         :return: True if valid, False otherwise
         :rtype: bool
         """
-        if not filepath or not isinstance(filepath, str):
+        # Must be a string starting with /; checked first as the cheapest reject
+        if not isinstance(filepath, str) or not filepath or filepath[0] != '/':
             return False
         
-        # Check for dangerous path components
-        dangerous_chars = ['..', '<', '>', '|', '*', '?', '"']
-        for char in dangerous_chars:
-            if char in filepath:
-                return False
-        
-        # Must start with /
-        if not filepath.startswith('/'):
+        # Check for dangerous path components: '..' is one C-level search,
+        # the single characters one pass over the path
+        if '..' in filepath:
             return False
+        for char in filepath:
+            if char in _DANGEROUS_CHARS:
+                return False
         
-        # Check file extension if it's a file (has extension)
-        if '.' in filepath.split('/')[-1]:
-            ext = '.' + filepath.split('.')[-1].lower()
+        # Check file extension if it's a file (has extension); the last
+        # '/' and '.' positions give it without splitting the path
+        dot = filepath.rfind('.')
+        if dot > filepath.rfind('/'):
+            ext = filepath[dot:].lower()
             if ext not in self.allowed_extensions:
                 self.foundation.startup_print(f"File extension {ext} not allowed")
                 return False
@@ -218,17 +355,27 @@ class SDCardModule(PicowicdModule):
             return False
         
         try:
+            # Walk the tree with an explicit stack rather than recursion, so
+            # deep trees cannot exhaust the interpreter stack. Files go as
+            # they are found; directories are collected parents-first.
+            dirs = [dirpath]
             if recursive:
-                # Delete contents first
-                items = self.list_directory(dirpath)
-                for item in items:
-                    if item['type'] == 'directory':
-                        self.delete_directory(item['path'], recursive=True)
-                    else:
-                        self.delete_file(item['path'])
+                stack = [dirpath]
+                while stack:
+                    current = stack.pop()
+                    prefix = current.rstrip('/') + '/'
+                    for item in os.listdir(current):
+                        item_path = prefix + item
+                        if os.stat(item_path)[0] & _S_IFDIR:
+                            dirs.append(item_path)
+                            stack.append(item_path)
+                        else:
+                            self.delete_file(item_path)
             
-            os.rmdir(dirpath)
-            self.foundation.startup_print(f"Directory deleted: {dirpath}")
+            # Reversed, every directory comes after all of its descendants
+            for path in reversed(dirs):
+                os.rmdir(path)
+                self.foundation.startup_print(f"Directory deleted: {path}")
             return True
         except Exception as e:
             self.foundation.startup_print(f"Error deleting directory {dirpath}: {str(e)}")
@@ -252,15 +399,18 @@ class SDCardModule(PicowicdModule):
             return False
         
         try:
-            # Read source file in chunks to handle large files
-            chunk_size = 1024
+            # Copy in chunks through one reused buffer to handle large files
+            if self._copy_buf is None:
+                self._copy_buf = bytearray(COPY_CHUNK_SIZE)
+            buf = self._copy_buf
+            view = memoryview(buf)
             with open(source_path, 'rb') as src:
                 with open(dest_path, 'wb') as dst:
                     while True:
-                        chunk = src.read(chunk_size)
-                        if not chunk:
+                        n = src.readinto(buf)
+                        if not n:
                             break
-                        dst.write(chunk)
+                        dst.write(buf if n == COPY_CHUNK_SIZE else view[:n])
             
             self.foundation.startup_print(f"File copied: {source_path} -> {dest_path}")
             return True
@@ -282,6 +432,18 @@ class SDCardModule(PicowicdModule):
         if not self.card_available:
             return False
         
+        if not self._validate_file_path(source_path) or not self._validate_file_path(dest_path):
+            return False
+        
+        # A rename only rewrites the directory entry; fall back to copy and
+        # delete when it fails (e.g. the destination already exists)
+        try:
+            os.rename(source_path, dest_path)
+            self.foundation.startup_print(f"File moved: {source_path} -> {dest_path}")
+            return True
+        except OSError:
+            pass
+        
         if self.copy_file(source_path, dest_path):
             if self.delete_file(source_path):
                 self.foundation.startup_print(f"File moved: {source_path} -> {dest_path}")
@@ -301,9 +463,9 @@ class SDCardModule(PicowicdModule):
         :return: File extension (including dot) or empty string
         :rtype: str
         """
-        if '.' in filepath.split('/')[-1]:
-            return '.' + filepath.split('.')[-1].lower()
-        return ''
+        name = filepath[filepath.rfind('/') + 1:]
+        dot = name.rfind('.')
+        return name[dot:].lower() if dot >= 0 else ''
 
     def get_file_type(self, filepath):
         """
@@ -314,21 +476,29 @@ class SDCardModule(PicowicdModule):
         :return: File type description
         :rtype: str
         """
-        ext = self.get_file_extension(filepath)
-        
-        type_map = {
-            '.txt': 'Text File',
-            '.log': 'Log File',
-            '.json': 'JSON Data',
-            '.csv': 'CSV Data',
-            '.py': 'Python Code',
-            '.md': 'Markdown',
-            '.html': 'HTML Document',
-            '.css': 'Stylesheet',
-            '.js': 'JavaScript'
-        }
+        return _TYPE_MAP.get(self.get_file_extension(filepath), 'Unknown File')
+
+    def _scan_directory(self, path, prefix):
+        """
+        Yield (name, path, mode, size) for each entry of a directory.
         
-        return type_map.get(ext, 'Unknown File')
+        With os.ilistdir the type (and, on most ports, the size) come from
+        the directory read itself; size is None when the port leaves it out.
+        Otherwise each entry costs one os.stat, and entries that cannot be
+        stat'ed are skipped.
+        """
+        if _ilistdir:
+            for entry in _ilistdir(path):
+                name = entry[0]
+                yield name, prefix + name, entry[1], entry[3] if len(entry) > 3 else None
+            return
+        for name in os.listdir(path):
+            item_path = prefix + name
+            try:
+                st = os.stat(item_path)
+            except OSError:
+                continue
+            yield name, item_path, st[0], st[6]
 
     def list_directory(self, path="/"):
         """
@@ -344,25 +514,42 @@ class SDCardModule(PicowicdModule):
         
         try:
             items = []
-            for item in os.listdir(path):
-                item_path = path.rstrip('/') + '/' + item if path != '/' else '/' + item
+            prefix = '/' if path == '/' else path.rstrip('/') + '/'
+            for item, item_path, mode, size in self._scan_directory(path, prefix):
                 try:
-                    stat_result = os.stat(item_path)
-                    is_dir = (stat_result[0] & 0x4000) != 0  # Check if directory
-                    
-                    items.append({
-                        'name': item,
-                        'path': item_path,
-                        'type': 'directory' if is_dir else 'file',
-                        'size': stat_result[6] if not is_dir else 0,
-                        'file_type': 'Directory' if is_dir else self.get_file_type(item_path),
-                        'extension': '' if is_dir else self.get_file_extension(item_path)
-                    })
+                    is_file = not mode & _S_IFDIR
+                    if is_file:
+                        if size is None:
+                            size = os.stat(item_path)[6]
+                        # Extension straight from the entry name, no path splitting
+                        dot = item.rfind('.')
+                        ext = item[dot:].lower() if dot >= 0 else ''
+                        entry = {
+                            'name': item,
+                            'path': item_path,
+                            'type': 'file',
+                            'size': size,
+                            'file_type': _TYPE_MAP.get(ext, 'Unknown File'),
+                            'extension': ext
+                        }
+                    else:
+                        entry = {
+                            'name': item,
+                            'path': item_path,
+                            'type': 'directory',
+                            'size': 0,
+                            'file_type': 'Directory',
+                            'extension': ''
+                        }
+                    # Sort key built once: directories first, then by name;
+                    # the index breaks ties so entries themselves are never compared
+                    items.append((is_file, item.lower(), len(items), entry))
                 except OSError:
-                    # Skip items we can't stat
+                    # Skip files whose size can't be read
                     continue
             
-            return sorted(items, key=lambda x: (x['type'] == 'file', x['name'].lower()))
+            items.sort()
+            return [keyed[3] for keyed in items]
             
         except Exception as e:
             self.foundation.startup_print(f"Error listing directory {path}: {str(e)}")
@@ -412,9 +599,20 @@ class SDCardModule(PicowicdModule):
             return None
         
         try:
-            with open(filepath, 'r') as f:
-                content = f.read(max_size)
-            return content
+            with open(filepath, 'rb') as f:
+                if max_size > READ_BUF_SIZE:
+                    # One-shot read; large buffers are not kept around
+                    data = f.read(max_size)
+                    n = len(data)
+                else:
+                    data = self._read_buf
+                    if data is None:
+                        data = self._read_buf = bytearray(READ_BUF_SIZE)
+                    n = f.readinto(memoryview(data)[:max_size]) or 0
+            if n == max_size:
+                n = _utf8_complete_len(data, n)
+            # Decoding is the only per-call copy
+            return bytes(memoryview(data)[:n]).decode('utf-8') if n else ""
         except Exception as e:
             self.foundation.startup_print(f"Error reading file {filepath}: {str(e)}")
             return None
@@ -438,14 +636,13 @@ class SDCardModule(PicowicdModule):
         if not self._validate_file_path(filepath):
             return False
         
-        # For append mode, check final size
-        if append and self.file_exists(filepath):
-            existing_size = self.get_file_info(filepath)
-            if existing_size:
-                total_size = existing_size.get('size', 0) + len(content)
-                if total_size > self.max_file_size:
-                    self.foundation.startup_print(f"Append would exceed file size limit")
-                    return False
+        # For append mode, check final size with a single stat
+        st = self._stat_or_none(filepath) if append else None
+        if st is not None:
+            existing_size = 0 if st[0] & _S_IFDIR else st[6]
+            if existing_size + len(content) > self.max_file_size:
+                self.foundation.startup_print(f"Append would exceed file size limit")
+                return False
         elif not self._validate_file_size(content):
             return False
         
@@ -479,6 +676,13 @@ class SDCardModule(PicowicdModule):
             self.foundation.startup_print(f"Error deleting file {filepath}: {str(e)}")
             return False
 
+    def _stat_or_none(self, filepath):
+        """Return the os.stat() tuple for filepath, or None if it cannot be read."""
+        try:
+            return os.stat(filepath)
+        except OSError:
+            return None
+
     def file_exists(self, filepath):
         """
         Check if a file exists on the SD card.
@@ -491,11 +695,7 @@ class SDCardModule(PicowicdModule):
         if not self.card_available:
             return False
         
-        try:
-            os.stat(filepath)
-            return True
-        except OSError:
-            return False
+        return self._stat_or_none(filepath) is not None
 
     def get_file_info(self, filepath):
         """
@@ -510,14 +710,14 @@ class SDCardModule(PicowicdModule):
             return None
         
         try:
-            stat_result = os.stat(filepath)
-            is_dir = (stat_result[0] & 0x4000) != 0
+            st = os.stat(filepath)
+            is_dir = st[0] & _S_IFDIR
             
             return {
-                'name': filepath.split('/')[-1],
+                'name': filepath[filepath.rfind('/') + 1:],
                 'path': filepath,
                 'type': 'directory' if is_dir else 'file',
-                'size': stat_result[6] if not is_dir else 0,
+                'size': 0 if is_dir else st[6],
                 'file_type': 'Directory' if is_dir else self.get_file_type(filepath),
                 'extension': '' if is_dir else self.get_file_extension(filepath),
                 'exists': True
@@ -529,13 +729,20 @@ class SDCardModule(PicowicdModule):
         """
         Get current SD card status information.
         
+        The mount is probed on every call; the storage figures are refreshed
+        at most once per CARD_INFO_TTL seconds and reused in between. ``card_info`` is the module's
+        own dict, replaced rather than modified on refresh, so treat it as
+        read-only.
+        
         :return: Dictionary containing card status and storage info
         :rtype: dict
         """
         if self.card_available:
             # Refresh card info
             try:
-                self._detect_and_mount_card()
+                self._probe_mount()
+                if time.monotonic() - self._card_info_ts >= CARD_INFO_TTL:
+                    self._refresh_usage()
             except:
                 self.card_available = False
                 self.card_info = {}
@@ -543,7 +750,7 @@ class SDCardModule(PicowicdModule):
         return {
             'available': self.card_available,
             'mount_point': self.mount_point,
-            'card_info': self.card_info.copy()
+            'card_info': self.card_info
         }
 
     def register_routes(self, server):
@@ -561,10 +768,10 @@ class SDCardModule(PicowicdModule):
                     return Response(request, "SD card not available", content_type="text/plain")
 
                 card_info = status['card_info']
-                status_text = f"Storage: {card_info['total_mb']} MB total<br>"
-                status_text += f"Free: {card_info['free_mb']} MB<br>"
-                status_text += f"Used: {card_info['used_mb']} MB<br>"
-                status_text += f"Usage: {card_info['usage_percent']}%"
+                status_text = (f"Storage: {card_info['total_mb']} MB total<br>"
+                               f"Free: {card_info['free_mb']} MB<br>"
+                               f"Used: {card_info['used_mb']} MB<br>"
+                               f"Usage: {card_info['usage_percent']}%")
 
                 self.foundation.startup_print(f"SD Status: {card_info['total_mb']}MB total, {card_info['free_mb']}MB free, {card_info['usage_percent']}% used")
 
@@ -581,23 +788,24 @@ class SDCardModule(PicowicdModule):
                 if not self.card_available:
                     return Response(request, "SD card not available", content_type="text/plain")
 
-                # Get directory path from request, default to root
+                # The dashboard only lists the root; request-chosen paths are
+                # not accepted here
                 path = "/"
-                if hasattr(request, 'form') and 'path' in request.form:
-                    path = request.form['path']
 
                 files = self.list_directory(path)
                 
                 if not files:
                     return Response(request, f"No files found in {path}", content_type="text/plain")
 
-                # Build HTML file listing
-                files_html = f"<strong>Contents of {path}:</strong><br><br>"
+                # Build HTML file listing from parts joined once
+                parts = [f"<strong>Contents of {path}:</strong><br><br>"]
                 
                 for item in files:
-                    icon = "📁" if item['type'] == 'directory' else "📄"
-                    size_text = f" ({item['size']} bytes)" if item['type'] == 'file' else ""
-                    files_html += f"{icon} {item['name']}{size_text}<br>"
+                    if item['type'] == 'file':
+                        parts.append(f"📄 {item['name']} ({item['size']} bytes)<br>")
+                    else:
+                        parts.append(f"📁 {item['name']}<br>")
+                files_html = "".join(parts)
 
                 self.foundation.startup_print(f"SD Files: Listed {len(files)} items in {path}")
 
@@ -618,77 +826,7 @@ class SDCardModule(PicowicdModule):
         :return: HTML string containing dashboard widget
         :rtype: str
         """
-        return '''
-        <div class="module">
-            <h3>SD Card Control</h3>
-            <div class="control-group">
-                <button id="sd-status-btn" onclick="getSDStatus()">Get SD Status</button>
-                <button id="sd-files-btn" onclick="getSDFiles()">List Files</button>
-                <a href="/sd-browse" target="_blank" class="btn" style="display: inline-block; padding: 8px 16px; background: #27ae60; color: white; text-decoration: none; border-radius: 4px;">File Browser</a>
-            </div>
-            <p id="sd-display-status">SD Status: Click button</p>
-            <div id="sd-file-list" style="margin-top: 10px; padding: 10px; background: #f9f9f9; border-radius: 5px; display: none;">
-                <strong>Files:</strong><br>
-                <div id="sd-files-content"></div>
-            </div>
-        </div>
-
-        <script>
-        // JavaScript for Get SD Status
-        function getSDStatus() {
-            const btn = document.getElementById('sd-status-btn');
-            btn.disabled = true;
-            btn.textContent = 'Reading...';
-
-            fetch('/sd-status', { method: 'POST' })
-                .then(response => response.text())
-                .then(result => {
-                    btn.disabled = false;
-                    btn.textContent = 'Get SD Status';
-                    document.getElementById('sd-display-status').innerHTML = 'SD Status: ' + result;
-                })
-                .catch(error => {
-                    btn.disabled = false;
-                    btn.textContent = 'Get SD Status';
-                    document.getElementById('sd-display-status').textContent = 'Error: ' + error.message;
-                });
-        }
-
-        // JavaScript for List Files
-        function getSDFiles() {
-            const btn = document.getElementById('sd-files-btn');
-            const fileList = document.getElementById('sd-file-list');
-            const filesContent = document.getElementById('sd-files-content');
-            
-            btn.disabled = true;
-            btn.textContent = 'Loading...';
-
-            fetch('/sd-files', { method: 'POST' })
-                .then(response => response.text())
-                .then(result => {
-                    btn.disabled = false;
-                    btn.textContent = 'List Files';
-                    filesContent.innerHTML = result;
-                    fileList.style.display = 'block';
-                })
-                .catch(error => {
-                    btn.disabled = false;
-                    btn.textContent = 'List Files';
-                    filesContent.textContent = 'Error: ' + error.message;
-                    fileList.style.display = 'block';
-                });
-        }
-        </script>
-        '''
-
-    def update(self):
-        """
-        Periodic update method called by foundation system.
-        
-        Performs regular maintenance tasks if needed.
-        Currently no periodic tasks required for SD card.
-        """
-        pass
+        return _SD_DASHBOARD_HTML
 
     def cleanup(self):
         """
@@ -19,8 +19,7 @@ LOG_SENSOR_READINGS = False     # Log each sensor reading to foundation
 # === END CONFIGURATION ===
 
 import time
-import board
-import busio
+from micropython import const
 from module_base import PicowicdModule
 
 # Try to import SHT4x library, create mock if not available
@@ -57,6 +56,38 @@ except ImportError:
     
     SHT4X_AVAILABLE = False
 
+# const() only folds integers, so the float/string settings above stay plain
+# globals; they are read once in __init__ rather than on each sample
+_SHT45_ADDRESS = const(0x44)  # fixed I2C address of the SHT45
+
+# Precision mode names mapped to sensor mode constants, resolved once at import
+_MODE_MAP = {
+    "HIGH": adafruit_sht4x.Mode.NOHEAT_HIGHPRECISION,
+    "MED": adafruit_sht4x.Mode.NOHEAT_MEDPRECISION,
+    "LOW": adafruit_sht4x.Mode.NOHEAT_LOWPRECISION
+}
+
+def _build_crc8_table():
+    """Precompute CRC-8 (poly 0x31) remainders for every byte value."""
+    table = bytearray(256)
+    for value in range(256):
+        crc = value
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ 0x31) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table[value] = crc
+    return bytes(table)
+
+# CircuitPython builds do not enable the viper/native emitters, so the CRC is
+# table-driven instead: two lookups per checked word rather than 16 shift/xor steps
+_CRC8_TABLE = _build_crc8_table()
+
+def _crc8(buffer, start):
+    """CRC-8 (init 0xFF, poly 0x31) over the two data bytes at ``start``."""
+    return _CRC8_TABLE[_CRC8_TABLE[0xFF ^ buffer[start]] ^ buffer[start + 1]]
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/picowicd/picowicd.git"
 
@@ -76,16 +107,34 @@ class SHT45Module(PicowicdModule):
         # Configuration from module parameters
         self.read_interval = SENSOR_READ_INTERVAL
         self.temperature_units = TEMPERATURE_UNITS
+        self._use_fahrenheit = TEMPERATURE_UNITS == "F"
         self.auto_updates_enabled = ENABLE_AUTO_UPDATES
         self.log_readings = LOG_SENSOR_READINGS
+        self._debug = bool(getattr(foundation.config, "DEBUG_MODE", False))
         
         # Sensor state tracking
         self.sensor_available = False
         self.last_reading_time = 0
         self.last_temperature = None
         self.last_humidity = None
+        self._cached_reading_bytes = b""  # "temperature,humidity", built on first request
+        self._cached_reading_at = 0  # last_reading_time the cached bytes were built for
         self.current_mode = DEFAULT_PRECISION_MODE
         self.current_heater = DEFAULT_HEATER_MODE
+        self.sensor_serial = None
+        self._serial_hex = "N/A"  # formatted once the serial has been read
+        
+        # Split measurement state: update() starts a conversion, then reads it
+        # back on a later tick once the mode's conversion time has elapsed
+        self._measure_started_at = None
+        # When update() next starts a measurement, anchored to the tick that
+        # started the previous one so the conversion time and scheduler
+        # rounding do not stretch the interval; update_delay() counts down
+        # to it from the clock reading of the last update() call
+        self._next_read_at = 0
+        self._last_update_at = None
+        self._command_buffer = bytearray(1)
+        self._measure_buffer = bytearray(6)
         
         # Status and error tracking
         self.status_message = "SHT45 module initialized"
@@ -93,20 +142,28 @@ class SHT45Module(PicowicdModule):
         
         # Initialize I2C and sensor hardware
         self._initialize_sensor()
+        self._refresh_sensor_info()
         
-        self.foundation.startup_print("SHT45 module created")
-        self.foundation.startup_print(f"Read interval: {self.read_interval}s")
-        self.foundation.startup_print(f"Temperature units: {self.temperature_units}")
+        if self._debug:
+            self.foundation.startup_print(
+                f"SHT45 module created\nRead interval: {self.read_interval}s\n"
+                f"Temperature units: {self.temperature_units}")
 
     def _initialize_sensor(self):
-        """Initialize I2C bus and SHT45 sensor hardware."""
+        """
+        Initialize I2C bus and SHT45 sensor hardware.
+        
+        Progress messages are only produced in debug mode; failures are
+        always recorded. Everything is sent to the startup log as one entry.
+        """
+        debug = self._debug
+        msgs = []
         try:
-            # Set up I2C bus (GP4=SDA, GP5=SCL to match other modules)
-            self.i2c = busio.I2C(board.GP5, board.GP4)
-            self.foundation.startup_print("I2C bus initialized (GP5=SCL, GP4=SDA)")
+            # Shared I2C bus (GP5=SCL, GP4=SDA) owned by the foundation
+            self.i2c = self.foundation.get_i2c()
             
-            if not SHT4X_AVAILABLE:
-                self.foundation.startup_print("Using mock SHT4x for testing (library not installed)")
+            if debug and not SHT4X_AVAILABLE:
+                msgs.append("Using mock SHT4x for testing (library not installed)")
             
             # Initialize SHT45 sensor (real or mock)
             self.sht45 = adafruit_sht4x.SHT4x(self.i2c)
@@ -115,25 +172,24 @@ class SHT45Module(PicowicdModule):
             # Get sensor serial number for identification
             try:
                 self.sensor_serial = self.sht45.serial_number
-                self.foundation.startup_print(f"SHT45 found! Serial: 0x{self.sensor_serial:08X}")
+                if self.sensor_serial:
+                    self._serial_hex = f"0x{self.sensor_serial:08X}"
+                if debug:
+                    msgs.append(f"SHT45 found! Serial: {self._serial_hex}")
             except Exception as e:
                 self.sensor_serial = None
-                self.foundation.startup_print(f"SHT45 serial read failed: {e}")
+                msgs.append(f"SHT45 serial read failed: {e}")
             
             # Set default mode
             try:
-                if DEFAULT_PRECISION_MODE == "HIGH":
-                    self.sht45.mode = adafruit_sht4x.Mode.NOHEAT_HIGHPRECISION
-                elif DEFAULT_PRECISION_MODE == "MED":
-                    self.sht45.mode = adafruit_sht4x.Mode.NOHEAT_MEDPRECISION  
-                else:  # LOW
-                    self.sht45.mode = adafruit_sht4x.Mode.NOHEAT_LOWPRECISION
+                self.sht45.mode = _MODE_MAP.get(DEFAULT_PRECISION_MODE, _MODE_MAP["LOW"])
                 
-                self.foundation.startup_print(f"SHT45 mode set to: {DEFAULT_PRECISION_MODE} precision")
-                self.status_message = f"SHT45 ready (Serial: 0x{self.sensor_serial:08X})" if self.sensor_serial else "SHT45 ready"
+                if debug:
+                    msgs.append(f"SHT45 mode set to: {DEFAULT_PRECISION_MODE} precision")
+                self.status_message = f"SHT45 ready (Serial: {self._serial_hex})" if self.sensor_serial else "SHT45 ready"
                 
             except Exception as e:
-                self.foundation.startup_print(f"SHT45 mode setting failed: {e}")
+                msgs.append(f"SHT45 mode setting failed: {e}")
                 self.status_message = "SHT45 connected but mode setting failed"
                 
         except Exception as e:
@@ -142,10 +198,70 @@ class SHT45Module(PicowicdModule):
             self.i2c = None
             self.last_error = f"SHT45 initialization failed: {e}"
             self.status_message = self.last_error
-            self.foundation.startup_print(self.last_error)
+            msgs.append(self.last_error)
+        
+        if msgs:
+            self.foundation.startup_print("\n".join(msgs))
+
+    def _store_reading(self, temperature_c, humidity):
+        """Convert units and record a new measurement as the current reading."""
+        # Convert temperature if needed
+        if self._use_fahrenheit:
+            temperature = (temperature_c * 9/5) + 32
+        else:
+            temperature = temperature_c
+        
+        # Update module state
+        self.last_temperature = temperature
+        self.last_humidity = humidity
+        self.last_reading_time = time.monotonic()
+        
+        # Log reading if enabled and in debug mode
+        if self.log_readings and self._debug:
+            self.foundation.startup_print(f"SHT45: {temperature:.1f}°{self.temperature_units}, {humidity:.1f}%RH")
+
+    def _start_measurement(self, now):
+        """Send the measure command for the current mode without waiting for it."""
+        self._command_buffer[0] = self.sht45.mode
+        i2c = self.i2c
+        while not i2c.try_lock():
+            pass
+        try:
+            i2c.writeto(_SHT45_ADDRESS, self._command_buffer)
+        finally:
+            i2c.unlock()
+        self._measure_started_at = now
+
+    def _finish_measurement(self):
+        """Read back and decode a measurement started by _start_measurement."""
+        self._measure_started_at = None
+        buf = self._measure_buffer
+        i2c = self.i2c
+        while not i2c.try_lock():
+            pass
+        try:
+            i2c.readfrom_into(_SHT45_ADDRESS, buf)
+        finally:
+            i2c.unlock()
+
+        if buf[2] != _crc8(buf, 0) or buf[5] != _crc8(buf, 3):
+            raise RuntimeError("Invalid CRC calculated")
+        
+        temperature_c = -45.0 + 175.0 * ((buf[0] << 8) | buf[1]) / 65535.0
+        humidity = -6.0 + 125.0 * ((buf[3] << 8) | buf[4]) / 65535.0
+        self._store_reading(temperature_c, max(min(humidity, 100), 0))
 
     def get_sensor_reading(self):
-        """Get current temperature and humidity readings from SHT45 sensor."""
+        """
+        Get current temperature and humidity readings from SHT45 sensor.
+        
+        With auto updates enabled this returns the reading most recently
+        collected by update(), so callers never wait on the I2C conversion.
+        A blocking measurement is only taken when no reading exists yet, or
+        when auto updates are disabled and the read interval has elapsed;
+        faster polls get the previous reading. Values are full precision;
+        rounding is left to whoever formats them for output.
+        """
         if not self.sensor_available or not self.sht45:
             return {
                 "success": False,
@@ -157,29 +273,15 @@ class SHT45Module(PicowicdModule):
             }
         
         try:
-            # Get measurements from sensor
-            temperature_c, humidity = self.sht45.measurements
-            
-            # Convert temperature if needed
-            if self.temperature_units == "F":
-                temperature = (temperature_c * 9/5) + 32
-            else:
-                temperature = temperature_c
-            
-            # Update module state
-            self.last_temperature = temperature
-            self.last_humidity = humidity
-            self.last_reading_time = time.monotonic()
-            
-            # Log reading if enabled and in debug mode
-            if self.log_readings and self.foundation.config.DEBUG_MODE:
-                self.foundation.startup_print(f"SHT45: {temperature:.1f}°{self.temperature_units}, {humidity:.1f}%RH")
+            if self._reading_stale():
+                # Get measurements from sensor
+                self._store_reading(*self.sht45.measurements)
             
             return {
                 "success": True,
                 "error": None,
-                "temperature": round(temperature, 1),
-                "humidity": round(humidity, 1),
+                "temperature": self.last_temperature,
+                "humidity": self.last_humidity,
                 "temperature_units": self.temperature_units,
                 "timestamp": self.last_reading_time
             }
@@ -198,6 +300,36 @@ class SHT45Module(PicowicdModule):
                 "timestamp": time.monotonic()
             }
 
+    def _reading_stale(self):
+        """Return True when a caller-driven read should measure the sensor."""
+        if self.last_temperature is None:
+            return True
+        if self.auto_updates_enabled:
+            return False
+        return time.monotonic() - self.last_reading_time >= self.read_interval
+
+    def get_sensor_reading_bytes(self):
+        """
+        Get the current reading as b"temperature,humidity" (two decimals).
+        
+        Measures only under the same interval gate as get_sensor_reading();
+        polls in between return the cached bytes without touching I2C.
+        Returns b"" when the sensor is unavailable or the read fails.
+        """
+        if not self.sensor_available or not self.sht45:
+            return b""
+        if self._reading_stale():
+            try:
+                self._store_reading(*self.sht45.measurements)
+            except Exception as e:
+                self.last_error = f"Reading failed: {e}"
+                self.foundation.startup_print(f"SHT45 error: {self.last_error}")
+        # Formatted only when asked for, once per new reading
+        if self._cached_reading_at != self.last_reading_time:
+            self._cached_reading_at = self.last_reading_time
+            self._cached_reading_bytes = b"%.2f,%.2f" % (self.last_temperature, self.last_humidity)
+        return self._cached_reading_bytes
+
     def set_measurement_mode(self, mode):
         """Set SHT45 measurement precision mode."""
         if not self.sensor_available or not self.sht45:
@@ -205,18 +337,14 @@ class SHT45Module(PicowicdModule):
         
         try:
             # Map mode strings to adafruit_sht4x constants
-            mode_map = {
-                "HIGH": adafruit_sht4x.Mode.NOHEAT_HIGHPRECISION,
-                "MED": adafruit_sht4x.Mode.NOHEAT_MEDPRECISION,
-                "LOW": adafruit_sht4x.Mode.NOHEAT_LOWPRECISION
-            }
-            
-            if mode not in mode_map:
+            sensor_mode = _MODE_MAP.get(mode)
+            if sensor_mode is None:
                 return False, f"Invalid mode: {mode}. Use HIGH, MED, or LOW"
             
             # Set the new mode
-            self.sht45.mode = mode_map[mode]
+            self.sht45.mode = sensor_mode
             self.current_mode = mode
+            self._refresh_sensor_info()
             
             self.foundation.startup_print(f"SHT45 mode changed to: {mode}")
             self.status_message = f"Mode: {mode} precision"
@@ -230,11 +358,26 @@ class SHT45Module(PicowicdModule):
             return False, error_msg
 
     def get_sensor_info(self):
-        """Get comprehensive sensor information and status."""
-        return {
+        """
+        Get comprehensive sensor information and status.
+        
+        The same dict is returned on every call with its reading and status
+        values refreshed in place; copy it to keep a snapshot.
+        """
+        info = self._sensor_info
+        info["last_reading_time"] = self.last_reading_time
+        info["last_temperature"] = self.last_temperature
+        info["last_humidity"] = self.last_humidity
+        info["status_message"] = self.status_message
+        info["last_error"] = self.last_error
+        return info
+
+    def _refresh_sensor_info(self):
+        """Rebuild the sensor info fields that only change on init or mode change."""
+        self._sensor_info = {
             "available": self.sensor_available,
             "serial_number": self.sensor_serial,
-            "serial_hex": f"0x{self.sensor_serial:08X}" if self.sensor_serial else "N/A",
+            "serial_hex": self._serial_hex,
             "current_mode": self.current_mode,
             "current_heater": self.current_heater,
             "last_reading_time": self.last_reading_time,
@@ -255,22 +398,62 @@ class SHT45Module(PicowicdModule):
         """No dashboard for node version."""
         return ""
 
-    def update(self):
-        """Periodic update method called by foundation system."""
-        if not self.auto_updates_enabled:
+    def update(self, now=None):
+        """
+        Periodic update method called by foundation system.
+        
+        Starts a measurement once the read interval has elapsed and reads
+        the result on a later call, after the mode's conversion time, so the
+        main loop is never blocked waiting on the sensor.
+        """
+        if not self.auto_updates_enabled or not self.sensor_available:
             return
             
-        current_time = time.monotonic()
+        current_time = time.monotonic() if now is None else now
+        self._last_update_at = current_time
         
-        # Auto-read sensor at configured interval
-        if current_time - self.last_reading_time >= self.read_interval:
-            if self.sensor_available:
-                reading = self.get_sensor_reading()
-                if reading['success'] and self.log_readings and self.foundation.config.DEBUG_MODE:
-                    self.foundation.debug_print(f"Auto-read: {reading['temperature']}°{reading['temperature_units']}, {reading['humidity']}%RH")
+        try:
+            # Collect a measurement in progress once its conversion is done
+            if self._measure_started_at is not None:
+                if current_time - self._measure_started_at >= adafruit_sht4x.Mode.delay[self.sht45.mode]:
+                    self._finish_measurement()
+                    if self.log_readings and self._debug:
+                        self.foundation.debug_print("Auto-read: %.1f°%s, %.1f%%RH", self.last_temperature,
+                                                    self.temperature_units, self.last_humidity)
+                return
+            
+            # Auto-read sensor at configured interval
+            if current_time >= self._next_read_at:
+                self._next_read_at = current_time + self.read_interval
+                if SHT4X_AVAILABLE:
+                    self._start_measurement(current_time)
+                else:
+                    # Mock sensor readings are immediate
+                    self._store_reading(*self.sht45.measurements)
+                    
+        except Exception as e:
+            self._measure_started_at = None
+            self._next_read_at = current_time + self.read_interval  # retry at the next interval
+            self.last_error = f"Reading failed: {e}"
+            self.foundation.startup_print(f"SHT45 error: {self.last_error}")
+
+    def update_delay(self):
+        """
+        Follow up after the conversion time while a measurement is pending,
+        otherwise when the next measurement is due.
+        """
+        if self._measure_started_at is not None:
+            return adafruit_sht4x.Mode.delay[self.sht45.mode]
+        if self._last_update_at is None:
+            return self.read_interval
+        return max(self._next_read_at - self._last_update_at, 0)
+
+    def set_debug(self, enabled):
+        """Update the cached debug flag when the foundation toggles DEBUG_MODE."""
+        self._debug = bool(enabled)
 
     def cleanup(self):
         """Cleanup method called during system shutdown."""
-        if self.sensor_available and self.foundation.config.DEBUG_MODE:
+        if self.sensor_available and self._debug:
             self.foundation.startup_print("SHT45 cleanup: Sensor shutdown")
         pass
\ No newline at end of file
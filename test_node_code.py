@@ -11,7 +11,7 @@ def main():
         print("=== WICDPICO-NODE TEST - FOUNDATION CORE ===")
         
         # Replace your foundation_core.py with the new version first
-        from foundation_core import PicowicdFoundation
+        from foundation_core import PicowicdFoundation, GC_LOW_MEMORY
         foundation = PicowicdFoundation()
         
         print(f"WiFi mode locked to: {foundation.wifi_mode}")
@@ -45,7 +45,9 @@ def main():
                     module.update()
                 time.sleep(1)
                 print(f"Test cycle {i+1}/10 complete")
-                gc.collect()
+                # Collect only under memory pressure, as the main loop does
+                if gc.mem_free() < GC_LOW_MEMORY:
+                    gc.collect()
             
             print("✓ Foundation core test PASSED")
             print("Ready for Step 5")
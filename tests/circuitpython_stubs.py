@@ -0,0 +1,78 @@
+"""
+Stand-ins for the CircuitPython-only modules the node code imports.
+
+Importing this module registers minimal fakes in ``sys.modules`` so the
+foundation and modules can be exercised under desktop Python. The fakes only
+provide what import time and the code paths under test touch.
+"""
+import os
+import sys
+import types
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def _module(name, **attrs):
+    module = types.ModuleType(name)
+    module.__dict__.update(attrs)
+    sys.modules.setdefault(name, module)
+    return sys.modules[name]
+
+
+class _Radio:
+    connected = False
+    ipv4_address = None
+
+
+class FakeI2C:
+    """I2C bus that answers every read with a fixed, CRC-valid SHT45 frame."""
+
+    # 0x6666 -> ~25 C, 0x8000 -> ~56.5 %RH, each followed by its CRC-8
+    FRAME = bytes((0x66, 0x66, 0x93, 0x80, 0x00, 0xA2))
+
+    def __init__(self):
+        self.writes = 0
+        self.reads = 0
+
+    def try_lock(self):
+        return True
+
+    def unlock(self):
+        pass
+
+    def writeto(self, address, buffer):
+        self.writes += 1
+
+    def readfrom_into(self, address, buffer):
+        self.reads += 1
+        buffer[:] = self.FRAME
+
+    def deinit(self):
+        pass
+
+
+class _Mode:
+    NOHEAT_HIGHPRECISION = 0xFD
+    NOHEAT_MEDPRECISION = 0xF6
+    NOHEAT_LOWPRECISION = 0xE0
+    delay = {0xFD: 0.0082, 0xF6: 0.0045, 0xE0: 0.0017}
+
+
+class _SHT4x:
+    def __init__(self, i2c):
+        self.mode = _Mode.NOHEAT_HIGHPRECISION
+        self.serial_number = 0x12345678
+
+
+_module("wifi", radio=_Radio())
+_module("socketpool", SocketPool=object)
+_module("ipaddress")
+_module("microcontroller", nvm=None)
+_module("board", GP4=4, GP5=5)
+_module("busio", I2C=lambda scl, sda: FakeI2C())
+_module("micropython", const=lambda value: value)
+_module("adafruit_sht4x", Mode=_Mode, SHT4x=_SHT4x)
+_module("storage")
+_module("adafruit_httpserver", Request=object, Response=object)
@@ -0,0 +1,67 @@
+"""Foundation scheduler driving interval modules through update_modules(now)."""
+import unittest
+
+import circuitpython_stubs  # noqa: F401  (registers the hardware fakes)
+from foundation_core import PicowicdFoundation
+import sht45_module
+from sht45_module import SHT45Module
+
+
+class SHT45SchedulingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.foundation = PicowicdFoundation()
+        self.sht45 = SHT45Module(self.foundation)
+        self.foundation.register_module("sht45", self.sht45)
+        # Start every run from the same clock rather than the real one
+        self.foundation._scheduled[0][0] = 0.0
+
+    def run_loop(self, seconds, step=0.005):
+        """Call update_modules() at a fixed tick rate, like run_main_loop."""
+        ticks = int(seconds / step)
+        for tick in range(ticks + 1):
+            self.foundation.update_modules(tick * step)
+
+    def test_samples_at_configured_interval(self):
+        interval = self.sht45.read_interval
+        intervals = 5
+        self.run_loop(interval * intervals)
+        i2c = self.sht45.i2c
+        # One measurement at t=0, then one per elapsed interval
+        self.assertEqual(i2c.writes, intervals + 1)
+        self.assertGreaterEqual(i2c.reads, intervals)
+        self.assertIsNotNone(self.sht45.last_temperature)
+
+    def test_measurement_start_times_stay_on_interval(self):
+        interval = self.sht45.read_interval
+        starts = []
+        original = self.sht45._start_measurement
+
+        def record(now):
+            starts.append(now)
+            original(now)
+
+        self.sht45._start_measurement = record
+        self.run_loop(interval * 4)
+        gaps = [b - a for a, b in zip(starts, starts[1:])]
+        self.assertEqual(len(gaps), 4)
+        for gap in gaps:
+            # Within one tick of the interval, never a whole interval late
+            self.assertLess(abs(gap - interval), 0.0101)
+
+    def test_reading_is_decoded_from_frame(self):
+        self.run_loop(0.05)
+        self.assertAlmostEqual(self.sht45.last_humidity, 56.5, delta=0.1)
+        self.assertEqual(sht45_module.SHT4X_AVAILABLE, True)
+
+    def test_reading_bytes_built_on_request(self):
+        self.run_loop(0.05)
+        # Scheduled samples do not format the bytes; the first request does
+        self.assertEqual(self.sht45._cached_reading_bytes, b"")
+        reading = self.sht45.get_sensor_reading_bytes()
+        self.assertEqual(reading, b"%.2f,%.2f" % (self.sht45.last_temperature, self.sht45.last_humidity))
+        self.assertIs(self.sht45.get_sensor_reading_bytes(), reading)
+
+
+if __name__ == "__main__":
+    unittest.main()
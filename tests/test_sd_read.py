@@ -0,0 +1,32 @@
+"""Truncation handling in SDCardModule.read_file."""
+import unittest
+
+import circuitpython_stubs  # noqa: F401  (registers the hardware fakes)
+from sd_card_module import _utf8_complete_len
+
+
+class Utf8CompleteLenTest(unittest.TestCase):
+
+    def cut(self, data):
+        return data[:_utf8_complete_len(data, len(data))].decode("utf-8")
+
+    def test_ascii_is_kept(self):
+        self.assertEqual(self.cut(b"abc"), "abc")
+
+    def test_complete_multibyte_is_kept(self):
+        self.assertEqual(self.cut("a°".encode()), "a°")
+        self.assertEqual(self.cut("a€".encode()), "a€")
+        self.assertEqual(self.cut("a\U0001F331".encode()), "a\U0001F331")
+
+    def test_split_character_is_dropped(self):
+        for char in ("°", "€", "\U0001F331"):
+            encoded = ("ab" + char).encode()
+            for cut in range(3, len(encoded)):
+                self.assertEqual(self.cut(encoded[:cut]), "ab")
+
+    def test_empty(self):
+        self.assertEqual(_utf8_complete_len(b"", 0), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
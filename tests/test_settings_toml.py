@@ -0,0 +1,82 @@
+"""settings.toml parsing used by PicowicdFoundation.load_user_config."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import circuitpython_stubs  # noqa: F401  (registers the hardware fakes)
+import foundation_core
+from foundation_core import _read_settings_toml
+
+
+class ReadSettingsTomlTest(unittest.TestCase):
+
+    def parse(self, text):
+        fd, path = tempfile.mkstemp(suffix=".toml")
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        try:
+            return _read_settings_toml(path)
+        finally:
+            os.remove(path)
+
+    def test_plain_string_and_comment(self):
+        settings = self.parse('WIFI_SSID = "hub"  # network\n')
+        self.assertEqual(settings["WIFI_SSID"], "hub")
+
+    def test_escaped_backslash_before_closing_quote(self):
+        settings = self.parse('WIFI_PASSWORD = "pass\\\\"  # "quoted" comment\n')
+        self.assertEqual(settings["WIFI_PASSWORD"], "pass\\")
+
+    def test_escaped_quote(self):
+        settings = self.parse('WIFI_PASSWORD = "a\\"b"\n')
+        self.assertEqual(settings["WIFI_PASSWORD"], 'a"b')
+
+    def test_backslash_then_quote_sequence_decodes_left_to_right(self):
+        # \\ followed by \" is a backslash and a quote, not an escaped quote pair
+        settings = self.parse('KEY = "x\\\\\\"y"\n')
+        self.assertEqual(settings["KEY"], 'x\\"y')
+
+    def test_control_and_unicode_escapes(self):
+        settings = self.parse('KEY = "a\\tb\\nc\\u00e9\\U0001F600"\n')
+        self.assertEqual(settings["KEY"], "a\tb\nc\u00e9\U0001F600")
+
+    def test_unknown_escape_kept(self):
+        settings = self.parse('KEY = "C:\\qdir"\n')
+        self.assertEqual(settings["KEY"], "C:\\qdir")
+
+    def test_unquoted_value_strips_comment(self):
+        settings = self.parse("MQTT_PORT = 1883 # default\n")
+        self.assertEqual(settings["MQTT_PORT"], "1883")
+
+    def test_table_header_ends_top_level_keys(self):
+        settings = self.parse('WIFI_SSID = "top"\n[extra]\nWIFI_SSID = "nested"\nOTHER = "x"\n')
+        self.assertEqual(settings, {"WIFI_SSID": "top"})
+
+    def test_missing_file(self):
+        self.assertEqual(_read_settings_toml("/nonexistent/settings.toml"), {})
+
+
+class LoopTimingConfigTest(unittest.TestCase):
+
+    def load(self, settings):
+        foundation = foundation_core.PicowicdFoundation()
+        with mock.patch.object(foundation_core, "_read_settings_toml", return_value=settings):
+            foundation.load_user_config()
+        return foundation
+
+    def test_valid_override_applied(self):
+        foundation = self.load({"WIFI_SSID": "hub", "WIFI_PASSWORD": "pw", "LOOP_IDLE_SLEEP": "0.25"})
+        self.assertEqual(foundation.config.LOOP_IDLE_SLEEP, 0.25)
+
+    def test_bad_value_keeps_default_and_wifi(self):
+        default = foundation_core.PicowicdFoundation().config.LOOP_IDLE_SLEEP
+        for value in ("fast", "0", "-1"):
+            foundation = self.load({"WIFI_SSID": "hub", "WIFI_PASSWORD": "pw", "LOOP_IDLE_SLEEP": value})
+            self.assertFalse(foundation.config_failed)
+            self.assertEqual(foundation.config.LOOP_IDLE_SLEEP, default)
+            self.assertEqual(foundation.config.WIFI_SSID, "hub")
+
+
+if __name__ == "__main__":
+    unittest.main()